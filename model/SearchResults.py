@@ -61,6 +61,9 @@ class SearchResults:
         self.created_at = datetime.now().isoformat()
         self.total_results = 0
         self.queries_executed: Dict[str, int] = {}  # provider_id -> number of queries
+        
+        # Set when filter metadata is added, cleared by save(); shared by every window using this model
+        self.has_unsaved_changes = False
     
     def add_results(self, provider_id: str, results: List[Dict], queries: List[str] = None, queries_count: int = 0):
         """
@@ -108,6 +111,28 @@ class SearchResults:
         
         # Add filter metadata (save the score/probability)
         result["_filters"][filter_model] = score
+        self.has_unsaved_changes = True
+    
+    def add_filter_metadata_bulk(self, provider_id: str, filter_model: str, scores):
+        """
+        Add filter metadata to all results of a provider in one call.
+        
+        Args:
+            provider_id: Provider ID
+            filter_model: Name of the filter model
+            scores: Sequence of scores aligned with the provider's results list
+                    (extra scores are ignored, missing ones leave results untouched)
+        """
+        if provider_id not in self.results:
+            return
+        
+        for result, score in zip(self.results[provider_id], scores):
+            filters = result.get("_filters")
+            if filters is None:
+                result["_filters"] = {filter_model: score}
+            else:
+                filters[filter_model] = score
+        self.has_unsaved_changes = True
     
     def get_filtered_results(self, filter_model: str, threshold: float = 0.5) -> Dict[str, List[Dict]]:
         """
@@ -192,7 +217,7 @@ class SearchResults:
             storage_dir = os.path.join(project_root, storage_root, self.instance_id)
         return storage_dir
     
-    def save(self, storage_root: str = "storage", folder_name: str = None):
+    def save(self, storage_root: str = "storage", folder_name: str = None, overwrite: bool = True):
         """
         Save this search results instance to disk.
         
@@ -202,6 +227,7 @@ class SearchResults:
         Args:
             storage_root: Root storage directory
             folder_name: Optional custom folder name (uses instance_id if None)
+            overwrite: If False, raise FileExistsError when the folder already exists
         """
         # Use custom folder name if provided, otherwise use instance_id
         save_id = folder_name if folder_name else self.instance_id
@@ -212,8 +238,8 @@ class SearchResults:
         storage_path = self.get_storage_path(storage_root)
         self.instance_id = original_id
         
-        # Create directory if it doesn't exist
-        os.makedirs(storage_path, exist_ok=True)
+        # Create directory if it doesn't exist (raises FileExistsError if not overwriting)
+        os.makedirs(storage_path, exist_ok=overwrite)
         
         # Update info.json if it exists, otherwise create it
         info_path = os.path.join(storage_path, "info.json")
@@ -246,9 +272,11 @@ class SearchResults:
         results_filename = "results.json"
         
         # Save results file
+        # Serialized in one shot, then written in a single call (json.dump issues many small writes)
         results_path = os.path.join(storage_path, results_filename)
+        payload = json.dumps(self.results, indent=2, ensure_ascii=False)
         with open(results_path, "w", encoding="utf-8") as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
+            f.write(payload)
         
         # Save queries.json if queries exist (only once, not per filter)
         if self.queries:
@@ -257,6 +285,7 @@ class SearchResults:
                 with open(queries_path, "w", encoding="utf-8") as f:
                     json.dump(self.queries, f, indent=2, ensure_ascii=False)
         
+        self.has_unsaved_changes = False
         return storage_path
     
     @staticmethod
@@ -277,8 +306,8 @@ class SearchResults:
         
         # Load info.json
         info_path = os.path.join(storage_path, "info.json")
-        with open(info_path, "r", encoding="utf-8") as f:
-            info_data = json.load(f)
+        with open(info_path, "rb") as f:
+            info_data = json.loads(f.read())
         
         # Create instance
         instance = SearchResults(
@@ -298,8 +327,10 @@ class SearchResults:
         results_path = os.path.join(storage_path, results_filename)
         
         if os.path.exists(results_path):
-            with open(results_path, "r", encoding="utf-8") as f:
-                all_results = json.load(f)
+            # One binary read handed straight to the parser (no text-layer decode pass);
+            # the raw buffer is released as soon as parsing finishes
+            with open(results_path, "rb") as f:
+                all_results = json.loads(f.read())
             
             # If a specific filter is requested, use get_filtered_results
             if filter_model:
@@ -318,8 +349,8 @@ class SearchResults:
         # Load queries.json if it exists
         queries_path = os.path.join(storage_path, "queries.json")
         if os.path.exists(queries_path):
-            with open(queries_path, "r", encoding="utf-8") as f:
-                instance.queries = json.load(f)
+            with open(queries_path, "rb") as f:
+                instance.queries = json.loads(f.read())
         
         return instance
     
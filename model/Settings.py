@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 from typing import Dict, Any, Optional
@@ -76,16 +77,40 @@ class Settings:
             self._settings = self.DEFAULTS.copy()
             self.save()
     
-    def save(self):
-        """Save current settings to JSON file."""
+    def save(self, settings: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Save current settings to JSON file.
+        
+        The file is written to a temporary file in one write, then
+        atomically moved over the settings file.
+        
+        Args:
+            settings: Optional dictionary of settings to apply before saving
+            
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        if settings:
+            self._settings.update(settings)
+        
         settings_path = self.get_settings_path()
+        tmp_path = settings_path + ".tmp"
         try:
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=2, ensure_ascii=False)
+            payload = json.dumps(self._settings, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, settings_path)
             return True
         except Exception as e:
             # Silent fail
             return False
+        finally:
+            # Only left behind when the write or replace failed
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -124,6 +149,7 @@ class Settings:
         self._settings.update(settings)
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_api_key_url(key_name: str) -> Optional[str]:
         """
         Get the URL to obtain an API key.
@@ -2,7 +2,7 @@
 Filtering strategies package for different GL providers.
 """
 
-from .base_strategy import FilteringStrategy, NoFilteringStrategy
+from .base_strategy import FilteringStrategy, NoFilteringStrategy, FilteringCancelled
 from .github_repos_strategy import GitHubReposFilteringStrategy
 from .github_issues_strategy import GitHubIssuesFilteringStrategy
 from .stackoverflow_strategy import StackOverflowFilteringStrategy
@@ -10,6 +10,7 @@ from .google_strategy import GoogleFilteringStrategy
 
 __all__ = [
     "FilteringStrategy",
+    "FilteringCancelled",
     "NoFilteringStrategy",
     "GitHubReposFilteringStrategy",
     "GitHubIssuesFilteringStrategy",
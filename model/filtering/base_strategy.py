@@ -3,20 +3,31 @@ Base filtering strategy with common utilities.
 """
 
 import os
+import threading
 import time
 import joblib
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple, Optional
 from openai import OpenAI
 from bs4 import BeautifulSoup
 
 from model.Settings import get_settings
 
 
+class FilteringCancelled(Exception):
+    """Raised when filtering is stopped through the strategy's cancel_event."""
+
+
 class FilteringStrategy(ABC):
     """Abstract base class for filtering strategies with common utilities."""
     
+    # Optional event checked between embedding batches; set it to stop filtering early
+    cancel_event: Optional[threading.Event] = None
+    
+    # Optional callback run before each cancel_event check (e.g. to process pending UI events)
+    before_batch: Optional[Callable[[], None]] = None
+    
     def __init__(self):
         """Initialize the filtering strategy with OpenAI client."""
         settings = get_settings()
@@ -152,6 +163,11 @@ class FilteringStrategy(ABC):
         list_embeddings = []
         
         for texts_batch in texts_batches:
+            if self.before_batch is not None:
+                self.before_batch()
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                raise FilteringCancelled()
+            
             print(f"Getting the embeddings of {len(texts_batch)} strings")
             response = self.client.embeddings.create(
                 model=embedding_model,
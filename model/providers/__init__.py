@@ -3,6 +3,8 @@ Grey Literature Providers package.
 Contains base provider class and concrete implementations for different search sources.
 """
 
+from typing import Optional
+
 from model.providers.base_provider import GLProvider
 from model.providers.google_provider import GoogleProvider
 from model.providers.github_issues_provider import GitHubIssuesProvider
@@ -36,6 +38,19 @@ def get_provider(provider_id: str) -> GLProvider:
     
     return provider_class()
 
+def get_provider_or_none(provider_id: str) -> Optional[GLProvider]:
+    """
+    Get a provider instance by ID without raising on unknown IDs.
+    
+    Args:
+        provider_id: Unique identifier for the provider
+        
+    Returns:
+        Provider instance, or None if provider_id is not recognized
+    """
+    provider_class = PROVIDER_CLASSES.get(provider_id)
+    return provider_class() if provider_class else None
+
 def get_all_providers() -> dict:
     """
     Get all available provider instances.
@@ -52,6 +67,7 @@ __all__ = [
     'GitHubReposProvider',
     'StackOverflowProvider',
     'get_provider',
+    'get_provider_or_none',
     'get_all_providers',
     'PROVIDER_CLASSES',
 ]
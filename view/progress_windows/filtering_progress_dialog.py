@@ -2,9 +2,15 @@
 Filtering progress dialog for ML filtering operations.
 """
 
+import threading
+import time
 import wx
 
 
+# Minimum time (seconds) between UI refreshes, caps repaint rate at ~20 Hz
+_MIN_REFRESH_INTERVAL = 0.05
+
+
 class FilteringProgressDialog(wx.Dialog):
     """Dialog showing progress of filtering operation."""
     
@@ -26,7 +32,8 @@ class FilteringProgressDialog(wx.Dialog):
         
         self.total_items = total_items
         self.current_item = 0
-        self.cancelled = False
+        self.cancel_event = threading.Event()  # Set once when the user cancels
+        self._last_refresh_ts = 0.0
         
         # Set window icon
         from view.utils.icon_helper import set_window_icon
@@ -97,7 +104,7 @@ class FilteringProgressDialog(wx.Dialog):
         self.details_text.AppendText(detail_msg)
         
         # Force UI update
-        wx.GetApp().Yield()
+        self._refresh_ui()
     
     def set_current_provider(self, provider_name: str, item_count: int):
         """
@@ -109,7 +116,7 @@ class FilteringProgressDialog(wx.Dialog):
         """
         self.current_provider_label.SetLabel(f"Filtering {provider_name}...")
         self.details_text.AppendText(f"⏳ Processing {provider_name} ({item_count} items)...\n")
-        wx.GetApp().Yield()
+        self._refresh_ui()
     
     def set_error(self, provider_name: str, error_msg: str):
         """
@@ -120,12 +127,33 @@ class FilteringProgressDialog(wx.Dialog):
             error_msg: Error message
         """
         self.details_text.AppendText(f"✗ [{provider_name}] ERROR: {error_msg}\n")
+        self._refresh_ui()
+    
+    def _refresh_ui(self):
+        """
+        Let the event loop repaint the dialog, at most every _MIN_REFRESH_INTERVAL.
+        
+        Widget state is always updated by the callers; only the event-loop
+        round-trip is skipped when updates arrive faster than the cap.
+        """
+        now = time.monotonic()
+        if now - self._last_refresh_ts < _MIN_REFRESH_INTERVAL:
+            return
+        self.process_events()
+    
+    def process_events(self):
+        """
+        Run pending UI events now so a Cancel click can set cancel_event.
+        
+        Filtering runs on the UI thread; call this before each cancellation check.
+        """
+        self._last_refresh_ts = time.monotonic()
         wx.GetApp().Yield()
     
     def on_cancel(self, event):
         """Handle cancel button click."""
         # Set cancelled flag immediately without confirmation dialog
-        self.cancelled = True
+        self.cancel_event.set()
         self.cancel_btn.Enable(False)
         self.cancel_btn.SetLabel("Cancelling...")
         self.current_provider_label.SetLabel("Cancelling filtering...")
@@ -138,4 +166,4 @@ class FilteringProgressDialog(wx.Dialog):
         Returns:
             True if cancelled, False otherwise
         """
-        return self.cancelled
+        return self.cancel_event.is_set()
@@ -5,16 +5,33 @@ Shows search results grouped by provider in a tabbed interface with tables.
 
 import wx
 import wx.grid as grid
+import functools
 import os
-import traceback
+import re
+import time
 from typing import Dict, List
 from view.utils.menu_bar import AppMenuBar
-from view.utils.navigation_controller import get_navigation_controller
+from view.utils.result_details_panel import ResultDetailsPanel
+from view.utils.icon_helper import set_window_icon
 
 
+# Characters not allowed in folder names (Windows + Unix)
+_INVALID_CHARS = r'<>:"/\\|?*'
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Reserved device names (Windows)
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9',
+})
+
+
+@functools.lru_cache(maxsize=128)
 def validate_folder_name(name: str) -> tuple:
     """
     Validate folder name for filesystem safety.
+    Results are cached since saves usually re-validate the same folder name.
     
     Returns:
         (is_valid, error_message)
@@ -23,28 +40,130 @@ def validate_folder_name(name: str) -> tuple:
         return False, "Folder name cannot be empty"
     
     # Check for invalid characters (Windows + Unix)
-    invalid_chars = r'<>:"/\\|?*'
-    if any(char in name for char in invalid_chars):
-        return False, f"Folder name contains invalid characters: {invalid_chars}"
+    if _INVALID_CHARS_RE.search(name):
+        return False, f"Folder name contains invalid characters: {_INVALID_CHARS}"
     
     # Check for reserved names (Windows)
-    reserved_names = ['CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'COM4', 
-                     'COM5', 'COM6', 'COM7', 'COM8', 'COM9', 'LPT1', 'LPT2', 
-                     'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9']
-    if name.upper() in reserved_names:
+    if name.upper() in _RESERVED_NAMES:
         return False, f"'{name}' is a reserved system name"
     
     # Check for special directory names
-    if name in ['.', '..']:
+    if name in ('.', '..'):
         return False, "Invalid folder name"
     
     # Check for trailing spaces or dots (Windows issue)
-    if name != name.rstrip('. '):
+    if name[-1] in '. ':
         return False, "Folder name cannot end with space or dot"
     
     return True, ""
 
 
+# Grid cells longer than this are truncated for display
+_MAX_CELL_CHARS = 200
+
+# Column widths are measured from the label and at most this many leading rows
+_COL_SIZE_SAMPLE_ROWS = 50
+
+# Column width limits (pixels) and padding added to the measured text width
+_MIN_COL_WIDTH = 100
+_MAX_COL_WIDTH = 300
+_COL_WIDTH_PADDING = 16
+
+# Clicks on Apply closer together than this (seconds) are treated as one
+_FILTER_CLICK_DEBOUNCE = 0.15
+
+# Columns shown for every provider without a dedicated layout
+_COMMON_COLS = ("title", "url", "snippet", "search_query")
+
+# Provider-specific columns
+_PROVIDER_COLS = {
+    "gh_repos": ("title", "url", "snippet", "stargazers_count", "language", "search_query"),
+    "gh_issues": ("title", "url", "state", "comments", "search_query"),
+    "so": ("title", "url", "score", "is_answered", "search_query"),
+    "google": ("title", "url", "snippet", "search_query"),
+}
+
+# Internal keys never shown as extra columns
+_SKIP_KEYS = frozenset({
+    "source", "relevant", "relevant_proba", "relevant_score",
+    "_original_index", "_filters", "search_intent",
+})
+
+# Keys under which filtering strategies report a result's relevance
+_PROBA_KEY = 'relevant_proba'
+_SCORE_KEY = 'relevant_score'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_default_storage_dir() -> str:
+    """Absolute path of the default storage directory (resolved once per process)."""
+    return os.path.abspath("storage")
+
+
+def _truncate_value(value):
+    """Truncate a single long string value for display in a grid cell."""
+    if isinstance(value, str) and len(value) > _MAX_CELL_CHARS:
+        return value[:_MAX_CELL_CHARS] + "..."
+    return value
+
+
+def _format_saved_info(storage_path: str, instance_id: str, available_filters: List[str]) -> str:
+    """Build the confirmation message shown after saving search results."""
+    if available_filters:
+        filters_info = (
+            f"✓ Saved with {len(available_filters)} filter(s):\n"
+            + "\n".join(f"  • {fname}" for fname in available_filters)
+        )
+    else:
+        filters_info = "✓ Saved (no filters applied yet)"
+    
+    return (
+        f"Search results saved successfully!\n\n"
+        f"Location: {storage_path}\n"
+        f"Instance ID: {instance_id}\n\n"
+        f"{filters_info}"
+    )
+
+
+def _relevance_score(result: dict) -> float:
+    """Get a scored result's relevance, preferring relevant_proba over relevant_score."""
+    try:
+        return float(result[_PROBA_KEY])
+    except KeyError:
+        return float(result.get(_SCORE_KEY, 0.0))
+
+
+class _ResultsGridTable(grid.GridTableBase):
+    """
+    Virtual grid table backed directly by a provider's result dicts.
+    Cell strings are produced (and truncated) only when the grid asks for them.
+    """
+    
+    def __init__(self, results: List[Dict], columns: List[str]):
+        super().__init__()
+        self.results = results
+        self.columns = columns
+    
+    def GetNumberRows(self):
+        return len(self.results)
+    
+    def GetNumberCols(self):
+        return len(self.columns)
+    
+    def GetColLabelValue(self, col):
+        return self.columns[col]
+    
+    def IsEmptyCell(self, row, col):
+        return False
+    
+    def GetValue(self, row, col):
+        return str(_truncate_value(self.results[row].get(self.columns[col], "")))
+    
+    def SetValue(self, row, col, value):
+        # Grid is read-only
+        pass
+
+
 class SearchResultsWindow(wx.Frame):
     """Window displaying search results grouped by provider."""
     
@@ -76,12 +195,14 @@ class SearchResultsWindow(wx.Frame):
         self.filter_applied = False  # Track if filtering has been applied
         self.current_filter_model = None  # Track which model was used for filtering
         self.storage_instance_id = None  # Track saved instance ID for reloading
+        self._filter_running = False  # Guard against re-entrant Apply clicks
+        self._last_filter_click = 0.0
+        self._info_dialog = None  # Reused for success/summary messages, see _show_info
         
         # Simple: always work with SearchResults model instance
         self.search_results_model = None  # The actual SearchResults instance
         
         # Set window icon
-        from view.utils.icon_helper import set_window_icon
         set_window_icon(self)
         
         self._build_ui(parent, search_results)
@@ -104,12 +225,8 @@ class SearchResultsWindow(wx.Frame):
         # Create instance using regular constructor
         instance = cls(parent, search_results, query_generation)
         
-        # Set filtering state
-        instance.filter_applied = True
-        instance.current_filter_model = filter_model_name
-        
-        # Rebuild UI to reflect filtered state
-        instance._rebuild_ui()
+        # Swap in the filtered view
+        instance.update_results(search_results, filter_model_name)
         
         return instance
     
@@ -143,7 +260,6 @@ class SearchResultsWindow(wx.Frame):
         left_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Right panel - Details panel (create BEFORE notebooks so grids can reference it)
-        from view.utils.result_details_panel import ResultDetailsPanel
         self.details_panel = ResultDetailsPanel(splitter)
         
         # Generation Summary Section (only if query_generation available)
@@ -188,7 +304,8 @@ class SearchResultsWindow(wx.Frame):
             # Total results
             total_results = sum(len(results) for results in self.search_results.values())
             summary_grid.Add(wx.StaticText(left_panel, label="Total Results:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-            summary_grid.Add(wx.StaticText(left_panel, label=str(total_results)), 0, wx.EXPAND)
+            self.total_results_label = wx.StaticText(left_panel, label=str(total_results))
+            summary_grid.Add(self.total_results_label, 0, wx.EXPAND)
             
             header_box.Add(summary_grid, 0, wx.ALL | wx.EXPAND, 5)
             left_sizer.Add(header_box, 0, wx.ALL | wx.EXPAND, 5)
@@ -200,18 +317,18 @@ class SearchResultsWindow(wx.Frame):
             header_font = header_font.Bold()
             header_label.SetFont(header_font)
             left_sizer.Add(header_label, 0, wx.ALL, 5)
+            self.total_results_label = header_label
         
         # ML Filtering Options Section (always show, but indicate if filtered)
         filter_box = wx.StaticBoxSizer(wx.VERTICAL, left_panel, "ML Filtering Options to keep relevant results only")
         
-        # Show status if filtering has been applied
-        if self.filter_applied:
-            status_label = wx.StaticText(left_panel, label=f"✓ Showing only relevant results (filtered with {self.current_filter_model})")
-            status_font = status_label.GetFont()
-            status_font = status_font.Bold()
-            status_label.SetFont(status_font)
-            status_label.SetForegroundColour(wx.Colour(0, 128, 0))  # Green color
-            filter_box.Add(status_label, 0, wx.ALL | wx.CENTER, 5)
+        # Status shown when filtering has been applied (hidden otherwise)
+        self.filter_status_label = wx.StaticText(left_panel, label="")
+        status_font = self.filter_status_label.GetFont()
+        status_font = status_font.Bold()
+        self.filter_status_label.SetFont(status_font)
+        self.filter_status_label.SetForegroundColour(wx.Colour(0, 128, 0))  # Green color
+        filter_box.Add(self.filter_status_label, 0, wx.ALL | wx.CENTER, 5)
         
         filter_inner_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
@@ -230,15 +347,6 @@ class SearchResultsWindow(wx.Frame):
             majorDimension=1,
             style=wx.RA_SPECIFY_COLS
         )
-        # Set selection based on current filter state
-        if self.filter_applied:
-            if self.current_filter_model == "text-embedding-3-small":
-                self.filter_choice.SetSelection(1)
-            elif self.current_filter_model == "text-embedding-3-large":
-                self.filter_choice.SetSelection(2)
-        else:
-            self.filter_choice.SetSelection(0)  # Default to no filter
-        
         filter_inner_sizer.Add(self.filter_choice, 1, wx.EXPAND)
         
         # Apply button
@@ -250,84 +358,11 @@ class SearchResultsWindow(wx.Frame):
         left_sizer.Add(filter_box, 0, wx.ALL | wx.EXPAND, 5)
         
         # Notebook for providers
-        notebook = wx.Notebook(left_panel)
-        
-        # Create a tab for each provider with results
-        for provider_id, results in self.search_results.items():
-            # Create panel for this provider
-            provider_panel = wx.Panel(notebook)
-            provider_sizer = wx.BoxSizer(wx.VERTICAL)
-            
-            # Count label
-            count_label = wx.StaticText(provider_panel, label=f"{len(results)} results found")
-            count_font = count_label.GetFont()
-            count_font = count_font.Bold()
-            count_label.SetFont(count_font)
-            provider_sizer.Add(count_label, 0, wx.ALL, 5)
-            
-            # If no results, show a message
-            if not results:
-                message = f"No {'relevant' if self.filter_applied else ''} results found for this provider."
-                
-                no_results_label = wx.StaticText(provider_panel, label=message)
-                no_results_font = no_results_label.GetFont()
-                no_results_font = no_results_font.MakeItalic()
-                no_results_label.SetFont(no_results_font)
-                no_results_label.SetForegroundColour(wx.Colour(128, 128, 128))  # Gray color
-                provider_sizer.Add(no_results_label, 1, wx.ALL | wx.ALIGN_CENTER, 20)
-            else:
-                # Create grid for results
-                results_grid = grid.Grid(provider_panel)
-                
-                # Bind click event to show details
-                results_grid.Bind(grid.EVT_GRID_SELECT_CELL, lambda evt, pid=provider_id, res=results: self.on_cell_selected(evt, pid, res))
-                
-                # Determine columns based on first result
-                sample_result = results[0]
-                columns = self._get_columns_for_provider(provider_id, sample_result)
-                
-                results_grid.CreateGrid(len(results), len(columns))
-                
-                # Set column headers
-                for col_idx, col_name in enumerate(columns):
-                    results_grid.SetColLabelValue(col_idx, col_name)
-                
-                # Fill grid with data
-                for row_idx, result in enumerate(results):
-                    for col_idx, col_name in enumerate(columns):
-                        value = result.get(col_name, "")
-                        # Truncate long values
-                        if isinstance(value, str) and len(value) > 200:
-                            value = value[:200] + "..."
-                        results_grid.SetCellValue(row_idx, col_idx, str(value))
-                        results_grid.SetReadOnly(row_idx, col_idx)
-                
-                # Auto-size columns
-                results_grid.AutoSizeColumns()
-                
-                # Set column widths with limits
-                for col_idx in range(len(columns)):
-                    width = results_grid.GetColSize(col_idx)
-                    if width > 300:
-                        results_grid.SetColSize(col_idx, 300)
-                    elif width < 100:
-                        results_grid.SetColSize(col_idx, 100)
-                
-                provider_sizer.Add(results_grid, 1, wx.ALL | wx.EXPAND, 5)
-            
-            provider_panel.SetSizer(provider_sizer)
-            
-            # Get provider name for tab label
-            from model.providers import get_provider
-            try:
-                provider = get_provider(provider_id)
-                tab_label = f"{provider.name} ({len(results)})"
-            except:
-                tab_label = f"{provider_id} ({len(results)})"
-            
-            notebook.AddPage(provider_panel, tab_label)
+        self.notebook = wx.Notebook(left_panel)
+        self.notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self._on_tab_changed)
+        self._populate_notebook(self.search_results)
         
-        left_sizer.Add(notebook, 1, wx.EXPAND)
+        left_sizer.Add(self.notebook, 1, wx.EXPAND)
         left_panel.SetSizer(left_sizer)
         
         # Split the window (60% left, 40% right)
@@ -353,11 +388,147 @@ class SearchResultsWindow(wx.Frame):
         
         panel.SetSizer(main_sizer)
         self.panel = panel  # Store panel for rebuilding
+        self._refresh_filter_status()
         self.Centre()
         
         # Bind close event to check for unsaved filters
         self.Bind(wx.EVT_CLOSE, self.on_close)
     
+    def _populate_notebook(self, search_results: Dict[str, List[Dict]]):
+        """Add one tab per provider to the results notebook."""
+        from model.providers import get_provider_or_none
+        
+        # Resolve provider display names once for all tab labels
+        provider_name_map = {
+            pid: (p.name if (p := get_provider_or_none(pid)) else pid)
+            for pid in search_results
+        }
+        
+        # Create a tab for each provider; grids are only built when a tab is first shown
+        for provider_id, results in search_results.items():
+            provider_panel = wx.Panel(self.notebook)
+            provider_panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            provider_panel._deferred_results = (provider_id, results)
+            
+            # Get provider name for tab label
+            tab_label = f"{provider_name_map[provider_id]} ({len(results)})"
+            self.notebook.AddPage(provider_panel, tab_label)
+        
+        # Populate the first tab eagerly for first paint
+        if self.notebook.GetPageCount():
+            self._ensure_tab_populated(self.notebook.GetPage(0))
+    
+    def _on_tab_changed(self, event):
+        """Populate a provider tab the first time it is activated."""
+        selection = event.GetSelection()
+        if selection != wx.NOT_FOUND:
+            self._ensure_tab_populated(self.notebook.GetPage(selection))
+        event.Skip()
+    
+    def _ensure_tab_populated(self, provider_panel):
+        """Build a provider tab's contents if they are still deferred."""
+        deferred = getattr(provider_panel, '_deferred_results', None)
+        if deferred is None:
+            return
+        
+        provider_panel._deferred_results = None
+        provider_id, results = deferred
+        self._populate_provider_panel(provider_panel, provider_id, results)
+        provider_panel.Layout()
+    
+    def _populate_provider_panel(self, provider_panel, provider_id: str, results: List[Dict]):
+        """Add the count label and results grid for one provider tab."""
+        provider_sizer = provider_panel.GetSizer()
+        
+        # Count label
+        count_label = wx.StaticText(provider_panel, label=f"{len(results)} results found")
+        count_font = count_label.GetFont()
+        count_font = count_font.Bold()
+        count_label.SetFont(count_font)
+        provider_sizer.Add(count_label, 0, wx.ALL, 5)
+        
+        # If no results, show a message
+        if not results:
+            message = f"No {'relevant' if self.filter_applied else ''} results found for this provider."
+            
+            no_results_label = wx.StaticText(provider_panel, label=message)
+            no_results_font = no_results_label.GetFont()
+            no_results_font = no_results_font.MakeItalic()
+            no_results_label.SetFont(no_results_font)
+            no_results_label.SetForegroundColour(wx.Colour(128, 128, 128))  # Gray color
+            provider_sizer.Add(no_results_label, 1, wx.ALL | wx.ALIGN_CENTER, 20)
+        else:
+            # Create grid for results
+            results_grid = grid.Grid(provider_panel)
+            
+            # Bind click event to show details
+            results_grid.Bind(grid.EVT_GRID_SELECT_CELL, lambda evt, pid=provider_id, res=results: self.on_cell_selected(evt, pid, res))
+            
+            # Determine columns based on first result
+            sample_result = results[0]
+            columns = self._get_columns_for_provider(provider_id, sample_result)
+            
+            # Cells are read straight from the results list on demand
+            table = _ResultsGridTable(results, columns)
+            results_grid.SetTable(table, True)
+            results_grid.EnableEditing(False)  # Read-only grid
+            
+            # Size columns from a sample of rows; AutoSizeColumns would call GetValue for every cell
+            sample_rows = min(len(results), _COL_SIZE_SAMPLE_ROWS)
+            for col_idx in range(len(columns)):
+                width = results_grid.GetTextExtent(table.GetColLabelValue(col_idx))[0]
+                for row in range(sample_rows):
+                    width = max(width, results_grid.GetTextExtent(table.GetValue(row, col_idx))[0])
+                width = min(max(width + _COL_WIDTH_PADDING, _MIN_COL_WIDTH), _MAX_COL_WIDTH)
+                results_grid.SetColSize(col_idx, width)
+            
+            provider_sizer.Add(results_grid, 1, wx.ALL | wx.EXPAND, 5)
+    
+    def _refresh_filter_status(self):
+        """Sync the result count, filter status label and filter choice with the current state."""
+        total_results = sum(len(results) for results in self.search_results.values())
+        if self.query_generation:
+            self.total_results_label.SetLabel(str(total_results))
+        else:
+            self.total_results_label.SetLabel(f"Total Results: {total_results}")
+        
+        if self.filter_applied:
+            self.filter_status_label.SetLabel(f"✓ Showing only relevant results (filtered with {self.current_filter_model})")
+            self.filter_status_label.Show()
+        else:
+            self.filter_status_label.Hide()
+        
+        # Set selection based on current filter state
+        if self.filter_applied:
+            if self.current_filter_model == "text-embedding-3-small":
+                self.filter_choice.SetSelection(1)
+            elif self.current_filter_model == "text-embedding-3-large":
+                self.filter_choice.SetSelection(2)
+        else:
+            self.filter_choice.SetSelection(0)  # Default to no filter
+    
+    def update_results(self, new_results: Dict[str, List[Dict]], filter_model_name: str = None):
+        """
+        Swap the displayed results in place, keeping the rest of the window.
+        
+        Args:
+            new_results: Dict mapping provider IDs to result lists
+            filter_model_name: Name of the model used for filtering, or None for all results
+        """
+        self.search_results = new_results
+        self.filter_applied = filter_model_name is not None
+        self.current_filter_model = filter_model_name
+        
+        self.Freeze()
+        try:
+            self.notebook.DeleteAllPages()
+            self._populate_notebook(new_results)
+            self._refresh_filter_status()
+            self.details_panel.clear()
+            self.panel.Layout()
+        finally:
+            self.Thaw()
+    
     def on_close(self, event):
         """Handle window close event - prompt to save unsaved changes."""
         # Prevent double-handling of close events
@@ -388,58 +559,32 @@ class SearchResultsWindow(wx.Frame):
         # Proceed with closing - let NavigationController handle it
         event.Skip()
     
-    def _rebuild_ui(self):
-        """Rebuild the UI to reflect current filter state."""
-        if hasattr(self, 'panel') and self.panel:
-            self.panel.Destroy()
-        self._build_ui(self, self.search_results)
+    def _show_info(self, title: str, message: str):
+        """Show an informational message, reusing one dialog instead of building a new one each time."""
+        if self._info_dialog is None:
+            self._info_dialog = wx.MessageDialog(self, "", "", wx.OK | wx.ICON_INFORMATION)
+        self._info_dialog.SetMessage(message)
+        self._info_dialog.SetTitle(title)
+        self._info_dialog.ShowModal()
     
     def _get_unsaved_changes(self) -> bool:
-        """Check if there are unsaved changes (new filters computed but not saved)."""
-        if not self.search_results_model or not self.storage_instance_id:
-            # If never saved, there are unsaved changes
-            return self.search_results_model is not None
-        
-        # Check if current model state differs from disk
-        from model.SearchResults import SearchResults
-        try:
-            disk_model = SearchResults.load(self.storage_instance_id, filter_model=None)
-            
-            # Compare available filters
-            current_filters = set(self.search_results_model.get_available_filters())
-            disk_filters = set(disk_model.get_available_filters())
-            
-            return current_filters != disk_filters
-        except:
-            # If can't load from disk, assume there are unsaved changes
-            return True
+        """Check if there are unsaved changes (never saved, or new filters computed but not saved)."""
+        model = self.search_results_model
+        if not model:
+            return False
+        # If never saved, there are unsaved changes
+        return model.has_unsaved_changes or not self.storage_instance_id
     
     def _get_columns_for_provider(self, provider_id: str, sample_result: dict) -> List[str]:
         """Determine which columns to display for a provider."""
-        # Check if results are filtered (have relevant_score field)
-        is_filtered = "relevant_score" in sample_result
-        
-        # Common columns
-        common_cols = ["title", "url", "snippet", "search_query"]
-        
-        # Provider-specific columns
-        provider_cols = {
-            "gh_repos": ["title", "url", "snippet", "stargazers_count", "language", "search_query"],
-            "gh_issues": ["title", "url", "state", "comments", "search_query"],
-            "so": ["title", "url", "score", "is_answered", "search_query"],
-            "google": ["title", "url", "snippet", "search_query"],
-        }
-        
         # Get base columns for this provider
-        if provider_id in provider_cols:
-            columns = provider_cols[provider_id].copy()
-        else:
-            # Use common columns plus any extra keys found in the sample
-            extra_keys = [k for k in sample_result.keys() 
-                         if k not in common_cols and k not in ["source", "relevant", "relevant_proba", "relevant_score", "_original_index", "_filters", "search_intent"]]
-            columns = common_cols + extra_keys[:3]  # Limit to avoid too many columns
+        if provider_id in _PROVIDER_COLS:
+            return list(_PROVIDER_COLS[provider_id])
         
-        return columns
+        # Use common columns plus any extra keys found in the sample
+        extra_keys = [k for k in sample_result
+                      if k not in _COMMON_COLS and k not in _SKIP_KEYS]
+        return list(_COMMON_COLS) + extra_keys[:3]  # Limit to avoid too many columns
     
     def on_show_all_results(self, event):
         """Show all unfiltered results (just change the view)."""
@@ -461,14 +606,8 @@ class SearchResultsWindow(wx.Frame):
                 wx.MessageBox("No results available.", "Error", wx.OK | wx.ICON_ERROR)
                 return
             
-            # Create new window with all results
-            new_window = SearchResultsWindow(None, all_results, self.query_generation)
-            new_window.storage_instance_id = self.storage_instance_id
-            new_window.search_results_model = self.search_results_model  # Share the same model
-            
-            # Navigate to new window
-            nav = get_navigation_controller()
-            nav.push(new_window, 'search_results', close_previous=True)
+            # Show all results in this window
+            self.update_results(all_results)
             
         except Exception as e:
             wx.MessageBox(f"Error loading all results: {e}", "Error", wx.OK | wx.ICON_ERROR)
@@ -477,6 +616,22 @@ class SearchResultsWindow(wx.Frame):
     
     def on_apply_filter(self, event):
         """Apply ML filtering based on selected option."""
+        # Ignore double-clicks and clicks while a filter run is still in progress
+        now = time.monotonic()
+        if self._filter_running or now - self._last_filter_click < _FILTER_CLICK_DEBOUNCE:
+            return
+        self._last_filter_click = now
+        
+        self._filter_running = True
+        self.apply_filter_btn.Disable()
+        try:
+            self._apply_filter(event)
+        finally:
+            self._filter_running = False
+            self.apply_filter_btn.Enable()
+    
+    def _apply_filter(self, event):
+        """Run the selected filter and show the result (called from on_apply_filter)."""
         # Get selected filter option
         selection = self.filter_choice.GetSelection()
         
@@ -486,20 +641,7 @@ class SearchResultsWindow(wx.Frame):
             return
         
         # Ensure we have a search_results_model
-        if not self.search_results_model:
-            # Create one from current results
-            from model.SearchResults import SearchResults
-            self.search_results_model = SearchResults(
-                query_generation_id=self.query_generation.instance_id if self.query_generation else "unknown",
-                intent=self.query_generation.intent if self.query_generation else "Search results",
-                providers=list(self.search_results.keys()),
-                instance_id=self.storage_instance_id
-            )
-            for provider_id, results in self.search_results.items():
-                queries_list = None
-                if self.query_generation and provider_id in self.query_generation.results:
-                    queries_list = self.query_generation.results[provider_id]
-                self.search_results_model.add_results(provider_id, results, queries=queries_list)
+        self._ensure_model(default_intent="Search results")
         
         # Determine which embedding model to use
         # selection == 1: text-embedding-3-small
@@ -513,18 +655,7 @@ class SearchResultsWindow(wx.Frame):
             filtered_results = self.search_results_model.get_filtered_results(model_name)
             
             # Show filtered view directly (no pop-up needed)
-            new_window = SearchResultsWindow.create_filtered(
-                None, 
-                filtered_results, 
-                self.query_generation,
-                model_name
-            )
-            new_window.storage_instance_id = self.storage_instance_id
-            new_window.search_results_model = self.search_results_model  # Share same model
-            
-            # Navigate to new window
-            nav = get_navigation_controller()
-            nav.push(new_window, 'search_results', close_previous=True)
+            self.update_results(filtered_results, model_name)
             return
         
         # Get the user's original search intent/message
@@ -569,11 +700,13 @@ class SearchResultsWindow(wx.Frame):
         from view.progress_windows.filtering_progress_dialog import FilteringProgressDialog
         progress_dlg = FilteringProgressDialog(self, total_items, model_name)
         progress_dlg.Show()
+        self._cancel_event = progress_dlg.cancel_event
         
         try:
             # Import provider system to get filtering strategies
             from model.providers import get_provider
             from model.GLProvider import GLProvider
+            from model.filtering import FilteringCancelled
             
             providers_list = GLProvider.get_providers_list()
             
@@ -586,9 +719,11 @@ class SearchResultsWindow(wx.Frame):
             source_results = self.search_results_model.results
             
             # Process each provider
+            cancel_event = self._cancel_event
             for provider_id, results in source_results.items():
-                # Check for cancellation
-                if progress_dlg.is_cancelled():
+                # Check for cancellation (process events first so a Cancel click is seen)
+                progress_dlg.process_events()
+                if cancel_event.is_set():
                     break
                 
                 if not results:
@@ -601,10 +736,6 @@ class SearchResultsWindow(wx.Frame):
                 
                 progress_dlg.set_current_provider(provider_name, len(results))
                 
-                # Check for cancellation after setting provider
-                if progress_dlg.is_cancelled():
-                    break
-                
                 # IMPORTANT: Add original index and search_intent to each result
                 results_with_intent = []
                 for idx, result in enumerate(results):
@@ -623,6 +754,10 @@ class SearchResultsWindow(wx.Frame):
                         filtered_results[provider_id] = results
                         continue
                     
+                    # Let the strategy stop between embedding batches if cancelled
+                    filtering_strategy.cancel_event = cancel_event
+                    filtering_strategy.before_batch = progress_dlg.process_events
+                    
                     # Use the appropriate filtering method based on model size
                     if use_large_model:
                         relevant, irrelevant = filtering_strategy.filter_large(results_with_intent)
@@ -641,10 +776,8 @@ class SearchResultsWindow(wx.Frame):
                     # Update progress
                     progress_dlg.update_progress(provider_name, len(relevant), len(results))
                     
-                    # Check for cancellation after filtering
-                    if progress_dlg.is_cancelled():
-                        break
-                    
+                except FilteringCancelled:
+                    break
                 except Exception as e:
                     import traceback
                     traceback.print_exc()
@@ -653,7 +786,7 @@ class SearchResultsWindow(wx.Frame):
                     filtered_results[provider_id] = results
             
             # Check if cancelled
-            was_cancelled = progress_dlg.cancelled
+            was_cancelled = cancel_event.is_set()
             
             # Close progress dialog
             progress_dlg.Close()
@@ -661,54 +794,45 @@ class SearchResultsWindow(wx.Frame):
             
             # If cancelled, show message and don't continue
             if was_cancelled:
-                wx.MessageBox(
-                    "Filtering was cancelled.\n\nNo changes were made to the results.",
+                self._show_info(
                     "Filtering Cancelled",
-                    wx.OK | wx.ICON_INFORMATION
+                    "Filtering was cancelled.\n\nNo changes were made to the results."
                 )
                 return
             
             # IMPORTANT: Save filter scores directly to the model using original indices
+            model = self.search_results_model
+            model_results = model.results
+            add_filter_metadata_bulk = model.add_filter_metadata_bulk
             for provider_id, scored_results in all_scored_results.items():
-                if provider_id in self.search_results_model.results:
-                    base_provider_results = self.search_results_model.results[provider_id]
+                if provider_id in model_results:
+                    base_provider_results = model_results[provider_id]
                     
-                    # Build index to score mapping from ALL scored results
-                    index_to_score = {}
-                    for result in scored_results:
-                        if '_original_index' in result:
-                            # Get the score from relevant_proba or relevant_score
-                            score = result.get('relevant_proba', result.get('relevant_score', 0.0))
-                            index_to_score[result['_original_index']] = float(score)
+                    # Scatter scores from ALL scored results into a list indexed by original position
+                    scores = [0.0] * len(base_provider_results)  # 0.0 if not scored
+                    if scored_results and '_original_index' in scored_results[0]:
+                        # Every result was tagged before filtering, so skip the per-row check
+                        for result in scored_results:
+                            scores[result['_original_index']] = _relevance_score(result)
+                    else:
+                        for result in scored_results:
+                            if '_original_index' in result:
+                                scores[result['_original_index']] = _relevance_score(result)
                     
                     # Add filter metadata for ALL results with their scores
-                    for idx in range(len(base_provider_results)):
-                        score = index_to_score.get(idx, 0.0)  # Default to 0.0 if not scored
-                        self.search_results_model.add_filter_metadata(provider_id, idx, model_name, score)
+                    add_filter_metadata_bulk(provider_id, model_name, scores)
             
             # Show summary
-            wx.MessageBox(
+            self._show_info(
+                "Filtering Complete",
                 f"Filtering complete using {model_name}!\n\n"
                 f"Relevant results kept: {total_relevant}\n"
                 f"Irrelevant results removed: {total_irrelevant}\n\n"
-                f"💡 Filter has been saved to memory. Click 'Save Results' to persist to disk.",
-                "Filtering Complete",
-                wx.OK | wx.ICON_INFORMATION
+                f"💡 Filter has been saved to memory. Click 'Save Results' to persist to disk."
             )
             
             # Show filtered view
-            new_window = SearchResultsWindow.create_filtered(
-                None, 
-                filtered_results, 
-                self.query_generation,
-                model_name
-            )
-            new_window.storage_instance_id = self.storage_instance_id
-            new_window.search_results_model = self.search_results_model  # Share same model
-            
-            # Navigate to new window
-            nav = get_navigation_controller()
-            nav.push(new_window, 'search_results', close_previous=True)
+            self.update_results(filtered_results, model_name)
             
         except ImportError as e:
             if progress_dlg:
@@ -728,6 +852,37 @@ class SearchResultsWindow(wx.Frame):
             import traceback
             traceback.print_exc()
     
+    def _ensure_model(self, default_intent: str = "Loaded search results"):
+        """
+        Make sure self.search_results_model exists, building it from the displayed results if needed.
+        
+        Args:
+            default_intent: Intent to record when there is no query generation
+        
+        Returns:
+            The SearchResults model for this window
+        """
+        if self.search_results_model:
+            return self.search_results_model
+        
+        query_generation = self.query_generation
+        search_results = self.search_results
+        
+        # Create one from current results
+        from model.SearchResults import SearchResults
+        model = SearchResults(
+            query_generation_id=query_generation.instance_id if query_generation else "unknown",
+            intent=query_generation.intent if query_generation else default_intent,
+            providers=list(search_results.keys()),
+            instance_id=self.storage_instance_id
+        )
+        qg_results = query_generation.results if query_generation else {}
+        for provider_id, results in search_results.items():
+            model.add_results(provider_id, results, queries=qg_results.get(provider_id))
+        
+        self.search_results_model = model
+        return model
+    
     def on_cell_selected(self, event, provider_id: str, results: list):
         """Handle grid cell selection to show result details."""
         row = event.GetRow()
@@ -740,35 +895,15 @@ class SearchResultsWindow(wx.Frame):
     
     def on_save_json(self, event):
         """Save current results - SIMPLE: just save the model to disk."""
-        from model.SearchResults import SearchResults
-        
         try:
+            # Ensure we have a model to save
+            self._ensure_model()
+            
             # If this window was opened from an existing saved folder (or previously saved), auto-save there
             if hasattr(self, '_loaded_storage_parent') and hasattr(self, '_loaded_folder_name'):
                 parent_path = self._loaded_storage_parent
                 folder_name = self._loaded_folder_name
 
-                # Ensure we have a model to save
-                if not self.search_results_model:
-                    # Create one from current results
-                    if self.query_generation:
-                        query_gen_id = self.query_generation.instance_id
-                        intent = self.query_generation.intent
-                    else:
-                        query_gen_id = "unknown"
-                        intent = "Loaded search results"
-                    self.search_results_model = SearchResults(
-                        query_generation_id=query_gen_id,
-                        intent=intent,
-                        providers=list(self.search_results.keys()),
-                        instance_id=self.storage_instance_id
-                    )
-                    for provider_id, results in self.search_results.items():
-                        queries_list = None
-                        if self.query_generation and provider_id in self.query_generation.results:
-                            queries_list = self.query_generation.results[provider_id]
-                        self.search_results_model.add_results(provider_id, results, queries=queries_list)
-
                 # Validate folder name
                 is_valid, error_msg = validate_folder_name(folder_name)
                 if not is_valid:
@@ -780,19 +915,8 @@ class SearchResultsWindow(wx.Frame):
                     storage_path = self.search_results_model.save(storage_root=parent_path, folder_name=folder_name)
                     self.storage_instance_id = folder_name
                     available_filters = self.search_results_model.get_available_filters()
-                    saved_info = [f"Location: {storage_path}", f"Instance ID: {self.storage_instance_id}"]
-                    if available_filters:
-                        saved_info.append(f"\n✓ Saved with {len(available_filters)} filter(s):")
-                        for fname in available_filters:
-                            saved_info.append(f"  • {fname}")
-                    else:
-                        saved_info.append("\n✓ Saved (no filters applied yet)")
 
-                    wx.MessageBox(
-                        f"Search results saved successfully!\n\n" + "\n".join(saved_info),
-                        "Success",
-                        wx.OK | wx.ICON_INFORMATION
-                    )
+                    self._show_info("Success", _format_saved_info(storage_path, self.storage_instance_id, available_filters))
                     return
                 except PermissionError:
                     wx.MessageBox("Permission denied. Please choose a different location.", "Error", wx.OK | wx.ICON_ERROR)
@@ -802,7 +926,7 @@ class SearchResultsWindow(wx.Frame):
                     return
 
             # Use file dialog to choose location and name in one step
-            default_dir = os.path.abspath("storage")
+            default_dir = _get_default_storage_dir()
             default_file = self.storage_instance_id if self.storage_instance_id else "search_results"
             
             dlg = wx.FileDialog(
@@ -822,8 +946,7 @@ class SearchResultsWindow(wx.Frame):
             dlg.Destroy()
             
             # Extract parent directory and folder name
-            parent_path = os.path.dirname(full_path)
-            folder_name = os.path.basename(full_path)
+            parent_path, folder_name = os.path.split(full_path)
             
             # Validate folder name
             is_valid, error_msg = validate_folder_name(folder_name)
@@ -831,9 +954,10 @@ class SearchResultsWindow(wx.Frame):
                 wx.MessageBox(error_msg, "Invalid Folder Name", wx.OK | wx.ICON_ERROR)
                 return
             
-            # Check if folder already exists
-            target_path = os.path.join(parent_path, folder_name)
-            if os.path.exists(target_path):
+            # Save using new API (no instance_id mutation); confirm only if the folder already exists
+            try:
+                storage_path = self.search_results_model.save(storage_root=parent_path, folder_name=folder_name, overwrite=False)
+            except FileExistsError:
                 dlg = wx.MessageDialog(
                     self,
                     f"Folder '{folder_name}' already exists.\n\nDo you want to overwrite it?",
@@ -844,52 +968,13 @@ class SearchResultsWindow(wx.Frame):
                     dlg.Destroy()
                     return
                 dlg.Destroy()
-            
-            # Ensure we have a search_results_model
-            if not self.search_results_model:
-                # Create one from current results
-                if self.query_generation:
-                    query_gen_id = self.query_generation.instance_id
-                    intent = self.query_generation.intent
-                else:
-                    query_gen_id = "unknown"
-                    intent = "Loaded search results"
-                
-                self.search_results_model = SearchResults(
-                    query_generation_id=query_gen_id,
-                    intent=intent,
-                    providers=list(self.search_results.keys()),
-                    instance_id=self.storage_instance_id
-                )
-                
-                for provider_id, results in self.search_results.items():
-                    queries_list = None
-                    if self.query_generation and provider_id in self.query_generation.results:
-                        queries_list = self.query_generation.results[provider_id]
-                    self.search_results_model.add_results(provider_id, results, queries=queries_list)
-            
-            # Save using new API (no instance_id mutation)
-            storage_path = self.search_results_model.save(storage_root=parent_path, folder_name=folder_name)
+                storage_path = self.search_results_model.save(storage_root=parent_path, folder_name=folder_name)
             self.storage_instance_id = folder_name
             
             # Show what was saved
             available_filters = self.search_results_model.get_available_filters()
             
-            saved_info = [f"Location: {storage_path}"]
-            saved_info.append(f"Instance ID: {self.storage_instance_id}")
-            
-            if available_filters:
-                saved_info.append(f"\n✓ Saved with {len(available_filters)} filter(s):")
-                for fname in available_filters:
-                    saved_info.append(f"  • {fname}")
-            else:
-                saved_info.append("\n✓ Saved (no filters applied yet)")
-            
-            wx.MessageBox(
-                f"Search results saved successfully!\n\n" + "\n".join(saved_info),
-                "Success",
-                wx.OK | wx.ICON_INFORMATION
-            )
+            self._show_info("Success", _format_saved_info(storage_path, self.storage_instance_id, available_filters))
             
         except PermissionError:
             wx.MessageBox("Permission denied. Please choose a different location.", "Error", wx.OK | wx.ICON_ERROR)
@@ -897,4 +982,5 @@ class SearchResultsWindow(wx.Frame):
             wx.MessageBox(f"Filesystem error: {e}", "Error", wx.OK | wx.ICON_ERROR)
         except Exception as e:
             wx.MessageBox(f"Error saving results: {e}", "Error", wx.OK | wx.ICON_ERROR)
+            import traceback
             traceback.print_exc()
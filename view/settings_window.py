@@ -1,33 +1,102 @@
 import wx
+import functools
+import weakref
 import webbrowser
-from model.Settings import get_settings, Settings
-from view.utils.menu_bar import AppMenuBar
-from view.utils.navigation_controller import get_navigation_controller
+
+
+# API key fields shown on the API Keys tab: (setting key, label, required)
+_API_KEY_SPEC = (
+    ("OPENAI_API_KEY", "OpenAI API Key", True),
+    ("GOOGLE_API_KEY", "Google API Key", True),
+    ("GOOGLE_CSE_CX", "Google Custom Search Engine ID", True),
+    ("STACKEXCHANGE_API_KEY", "Stack Exchange API Key", False),
+    ("GITHUB_TOKEN", "GitHub Personal Access Token", True),
+)
+
+# Value getter per control type for on_save; other controls (TextCtrl) use GetValue()
+_GETTERS = {
+    wx.SpinCtrl: wx.SpinCtrl.GetValue,
+    wx.SpinCtrlDouble: wx.SpinCtrlDouble.GetValue,
+    wx.ComboBox: wx.ComboBox.GetStringSelection,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _dots(n: int) -> str:
+    """Mask string shown in place of an API key of length n."""
+    return "•" * n
+
+
+@functools.lru_cache(maxsize=1)
+def _llm_choices_and_index() -> tuple:
+    """LLM model choices and a name -> position map, loaded once per session (imports LLMProvider on first use)."""
+    from model.LLMProvider import LLMProvider
+    choices = tuple(LLMProvider.get_model_choices())
+    return choices, {name: i for i, name in enumerate(choices)}
+
+
+def _find_model_index(default_model: str) -> int:
+    """Position of default_model among the LLM choices (exact match, else first containing it, else 0)."""
+    llm_models, llm_index = _llm_choices_and_index()
+    default_index = llm_index.get(default_model)
+    if default_index is None:
+        default_index = next((i for i, model in enumerate(llm_models) if default_model in model), 0)
+    return default_index
+
+
+@functools.lru_cache(maxsize=1)
+def _tier_tables() -> tuple:
+    """
+    OpenAI tier choices plus id -> choice and choice -> id maps, loaded once per session
+    (imports TierInfo on first use).
+    """
+    from model.TierInfo import get_tier_choices, get_tiers_data
+    choices = tuple(get_tier_choices())
+    # get_tier_choices formats the tiers in data.json order, so ids and choices line up
+    tier_ids = [tier['id'] for tier in get_tiers_data()]
+    return choices, dict(zip(tier_ids, choices)), dict(zip(choices, tier_ids))
+
+
+def _tier_choice_from_id(tier_id: str) -> str:
+    """UI choice string for a tier ID (TierInfo's fallback for unknown IDs)."""
+    choice = _tier_tables()[1].get(tier_id)
+    if choice is None:
+        from model.TierInfo import get_choice_from_tier_id
+        choice = get_choice_from_tier_id(tier_id)
+    return choice
+
+
+def _tier_id_from_choice(choice: str) -> str:
+    """Tier ID for a UI choice string (TierInfo's fallback for unknown choices)."""
+    tier_id = _tier_tables()[2].get(choice)
+    if tier_id is None:
+        from model.TierInfo import get_tier_id_from_choice
+        tier_id = get_tier_id_from_choice(choice)
+    return tier_id
 
 
 class SettingsWindow(wx.Frame):
     """Window for managing application settings (Singleton pattern)."""
     
-    _instance = None  # Class variable to hold singleton instance
+    _instance_ref = None  # Weak reference to the singleton instance, so closed windows can be reclaimed
     
     def __new__(cls, parent=None, tab_index: int = 0, opened_from_home: bool = False):
         """Ensure only one instance of SettingsWindow exists."""
-        if cls._instance is not None and cls._instance:
+        inst = cls._instance_ref() if cls._instance_ref else None
+        # A wx window is falsy once its C++ object is gone, so this is the whole liveness check
+        if inst and not inst.IsBeingDeleted():
             # If instance exists, just show it and bring to front
-            try:
-                nav = get_navigation_controller()
-                nav.show_and_raise(cls._instance)
-                # Update the tab if needed
-                if hasattr(cls._instance, 'notebook'):
-                    cls._instance.notebook.SetSelection(tab_index)
-                return cls._instance
-            except:
-                # Instance is dead, create new one
-                cls._instance = None
+            from view.utils.navigation_controller import get_navigation_controller
+            nav = get_navigation_controller()
+            nav.show_and_raise(inst)
+            # Update the tab if needed
+            if hasattr(inst, 'notebook'):
+                inst.notebook.SetSelection(tab_index)
+            return inst
         
         # Create new instance
         instance = super().__new__(cls)
-        cls._instance = instance
+        cls._instance_ref = weakref.ref(instance)
         return instance
     
     def __init__(self, parent=None, tab_index: int = 0, opened_from_home: bool = False):
@@ -50,40 +119,49 @@ class SettingsWindow(wx.Frame):
             style=wx.DEFAULT_FRAME_STYLE
         )
         
+        from model.Settings import get_settings
+        
         self._initialized = True
         self.settings = get_settings()
         self.modified = False
         self.opened_from_home = opened_from_home
         
+        # Field controls per tab; tabs are built lazily so these fill in as pages are first shown
+        self.api_key_fields = {}
+        self.query_fields = {}
+        self.search_fields = {}
+        self._built = set()
+        
         # Set window icon
         from view.utils.icon_helper import set_window_icon
         set_window_icon(self)
         
-        # Add menu bar
-        menu_bar = AppMenuBar(self)
-        self.SetMenuBar(menu_bar)
-        
         panel = wx.Panel(self)
         main_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Create notebook for organized settings
         notebook = wx.Notebook(panel)
-        
-        # API Keys Tab
-        api_panel = self.create_api_keys_panel(notebook)
-        notebook.AddPage(api_panel, "API Keys")
-        
-        # Query Defaults Tab
-        query_panel = self.create_query_defaults_panel(notebook)
-        notebook.AddPage(query_panel, "Query Defaults")
-        
-        # Search Settings Tab
-        search_panel = self.create_search_settings_panel(notebook)
-        notebook.AddPage(search_panel, "Search Settings")
-        
-        # Select the specified tab
-        if 0 <= tab_index < notebook.GetPageCount():
-            notebook.SetSelection(tab_index)
+        self.notebook = notebook
+        
+        # Tabs start as empty placeholders; each page's content is built the first time it is shown
+        self._page_builders = {
+            0: self.create_api_keys_panel,
+            1: self.create_query_defaults_panel,
+            2: self.create_search_settings_panel,
+        }
+        notebook.Freeze()
+        for label in ("API Keys", "Query Defaults", "Search Settings"):
+            placeholder = wx.Panel(notebook)
+            placeholder.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            notebook.AddPage(placeholder, label)
+        
+        # Select the specified tab (building only that one)
+        if not 0 <= tab_index < notebook.GetPageCount():
+            tab_index = 0
+        self._ensure_page(tab_index)
+        notebook.SetSelection(tab_index)
+        notebook.Thaw()
+        notebook.Bind(wx.EVT_NOTEBOOK_PAGE_CHANGED, self._on_page_changed)
         
         main_sizer.Add(notebook, 1, wx.ALL | wx.EXPAND, 10)
         
@@ -107,28 +185,53 @@ class SettingsWindow(wx.Frame):
         panel.SetSizer(main_sizer)
         self.Centre()
         
+        # Add menu bar once the window is up, so building it doesn't delay first paint
+        wx.CallAfter(self._install_menu_bar)
+        
         # Track changes
         self.Bind(wx.EVT_CLOSE, self.on_close)
     
+    def _install_menu_bar(self):
+        """Build and attach the application menu bar (deferred from __init__)."""
+        if not self:
+            return
+        from view.utils.menu_bar import AppMenuBar
+        self.SetMenuBar(AppMenuBar(self))
+    
+    def _on_page_changed(self, event):
+        """Build a tab's content the first time it is selected."""
+        self._ensure_page(event.GetSelection())
+        event.Skip()
+    
+    def _ensure_page(self, index: int):
+        """Build the content of notebook page `index` into its placeholder, once."""
+        if index in self._built or index not in self._page_builders:
+            return
+        self._built.add(index)
+        
+        placeholder = self.notebook.GetPage(index)
+        placeholder.Freeze()
+        content = self._page_builders[index](placeholder)
+        placeholder.GetSizer().Add(content, 1, wx.EXPAND)
+        placeholder.Layout()
+        placeholder.Thaw()
+    
     def create_api_keys_panel(self, parent):
         """Create the API Keys settings panel."""
         panel = wx.ScrolledWindow(parent)
         panel.SetScrollRate(5, 5)
+        panel.Freeze()
         sizer = wx.BoxSizer(wx.VERTICAL)
         
-        # Store text controls
-        self.api_key_fields = {}
+        # Label fonts, shared by all rows
+        base_font = panel.GetFont()
+        label_font = wx.Font(base_font)
+        label_font.SetPointSize(base_font.GetPointSize() + 1)
+        bold_font = wx.Font(label_font)
+        bold_font.MakeBold()
         
         # API Keys with help buttons
-        api_keys = [
-            ("OPENAI_API_KEY", "OpenAI API Key", True),
-            ("GOOGLE_API_KEY", "Google API Key", True),
-            ("GOOGLE_CSE_CX", "Google Custom Search Engine ID", True),
-            ("STACKEXCHANGE_API_KEY", "Stack Exchange API Key", False),
-            ("GITHUB_TOKEN", "GitHub Personal Access Token", True)
-        ]
-        
-        for key, label, required in api_keys:
+        for key, label, required in _API_KEY_SPEC:
             field_sizer = wx.BoxSizer(wx.VERTICAL)
             
             # Label with required indicator
@@ -136,11 +239,7 @@ class SettingsWindow(wx.Frame):
             if required:
                 label_text += " *"
             key_label = wx.StaticText(panel, label=label_text)
-            font = key_label.GetFont()
-            font.PointSize += 1
-            if required:
-                font = font.Bold()
-            key_label.SetFont(font)
+            key_label.SetFont(bold_font if required else label_font)
             field_sizer.Add(key_label, 0, wx.ALL, 5)
             
             # Input and help button row
@@ -148,7 +247,7 @@ class SettingsWindow(wx.Frame):
             
             # Text input (initially showing dots)
             initial_value = self.settings.get(key, "")
-            text_ctrl = wx.TextCtrl(panel, value="•" * len(initial_value), size=(450, -1))
+            text_ctrl = wx.TextCtrl(panel, value=_dots(len(initial_value)), size=(450, -1))
             text_ctrl.SetEditable(False)
             # Store actual value and visibility state as attributes
             text_ctrl.actual_value = initial_value
@@ -160,14 +259,16 @@ class SettingsWindow(wx.Frame):
             
             # Show/Hide button
             show_btn = wx.Button(panel, label="Show", size=(60, -1))
-            show_btn.Bind(wx.EVT_BUTTON, lambda evt, tc=text_ctrl, btn=show_btn: self.toggle_visibility(tc, btn))
+            show_btn.text_ctrl = text_ctrl
+            show_btn.Bind(wx.EVT_BUTTON, self._on_toggle_visibility)
             input_sizer.Add(show_btn, 0, wx.ALL, 2)
             
             # Help button
-            help_url = Settings.get_api_key_url(key)
+            help_url = self.settings.get_api_key_url(key)
             if help_url:
                 help_btn = wx.Button(panel, label="Get Key", size=(80, -1))
-                help_btn.Bind(wx.EVT_BUTTON, lambda evt, url=help_url: webbrowser.open(url))
+                help_btn.url = help_url
+                help_btn.Bind(wx.EVT_BUTTON, self._on_help_clicked)
                 input_sizer.Add(help_btn, 0, wx.ALL, 2)
             
             field_sizer.Add(input_sizer, 0, wx.ALL | wx.EXPAND, 2)
@@ -178,6 +279,7 @@ class SettingsWindow(wx.Frame):
             sizer.Add(field_sizer, 0, wx.ALL | wx.EXPAND, 5)
         
         panel.SetSizer(sizer)
+        panel.Thaw()
         return panel
     
     def create_query_defaults_panel(self, parent):
@@ -186,30 +288,20 @@ class SettingsWindow(wx.Frame):
         panel.SetScrollRate(5, 5)
         sizer = wx.BoxSizer(wx.VERTICAL)
         
-        # Store controls
-        self.query_fields = {}
-        
         # Default Model
         model_sizer = wx.BoxSizer(wx.HORIZONTAL)
         model_label = wx.StaticText(panel, label="Default LLM Model:")
         model_sizer.Add(model_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
         
-        # Get LLM model choices from LLMProvider
-        from model.LLMProvider import LLMProvider
-        llm_models = LLMProvider.get_model_choices()
+        # Get LLM model choices from LLMProvider (cached across Settings opens)
+        llm_models, _ = _llm_choices_and_index()
         
-        model_ctrl = wx.ComboBox(panel, choices=llm_models, style=wx.CB_READONLY, size=(250, -1))
+        model_ctrl = wx.ComboBox(panel, choices=list(llm_models), style=wx.CB_READONLY, size=(250, -1))
         
         # Set default model from settings
         default_model = self.settings.get('QUERY_DEFAULT_MODEL', 'gpt-4o')
         if llm_models:
-            # Try to find and select the default model
-            default_index = 0
-            for i, model in enumerate(llm_models):
-                if default_model in model:
-                    default_index = i
-                    break
-            model_ctrl.SetSelection(default_index)
+            model_ctrl.SetSelection(_find_model_index(default_model))
         
         model_ctrl.Bind(wx.EVT_COMBOBOX, self.on_field_changed)
         self.query_fields["QUERY_DEFAULT_MODEL"] = model_ctrl
@@ -238,9 +330,9 @@ class SettingsWindow(wx.Frame):
         
         temp_ctrl = wx.SpinCtrlDouble(
             panel,
-            value=str(self.settings.get("QUERY_FORGE_TEMPERATURE", 0.2)),
             min=0.0,
             max=1.0,
+            initial=float(self.settings.get("QUERY_FORGE_TEMPERATURE", 0.2)),
             inc=0.1,
             size=(100, -1)
         )
@@ -256,7 +348,7 @@ class SettingsWindow(wx.Frame):
         
         # Queries number (Google will auto-split 50/50 between docs and gray literature)
         numbers_grid.Add(wx.StaticText(panel, label="Default Queries Number:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        queries_ctrl = wx.SpinCtrl(panel, value=str(self.settings.get("QUERIES_DEFAULT_NUMBER", 10)), min=1, max=100, size=(100, -1))
+        queries_ctrl = wx.SpinCtrl(panel, min=1, max=100, initial=int(self.settings.get("QUERIES_DEFAULT_NUMBER", 10)), size=(100, -1))
         queries_ctrl.Bind(wx.EVT_SPINCTRL, self.on_field_changed)
         self.query_fields["QUERIES_DEFAULT_NUMBER"] = queries_ctrl
         numbers_grid.Add(queries_ctrl, 0, wx.EXPAND)
@@ -272,30 +364,27 @@ class SettingsWindow(wx.Frame):
         panel.SetScrollRate(5, 5)
         sizer = wx.BoxSizer(wx.VERTICAL)
         
-        # Store controls
-        self.search_fields = {}
-        
         # Search settings section
         search_box = wx.StaticBoxSizer(wx.VERTICAL, panel, "Search Settings")
         settings_grid = wx.FlexGridSizer(rows=3, cols=2, hgap=10, vgap=10)
         
         # Max results per query
         settings_grid.Add(wx.StaticText(panel, label="Max Results Per Query:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        max_query_ctrl = wx.SpinCtrl(panel, value=str(self.settings.get("MAX_RESULTS_PER_QUERY_DEFAULT", 50)), min=1, max=1000, size=(100, -1))
+        max_query_ctrl = wx.SpinCtrl(panel, min=1, max=1000, initial=int(self.settings.get("MAX_RESULTS_PER_QUERY_DEFAULT", 50)), size=(100, -1))
         max_query_ctrl.Bind(wx.EVT_SPINCTRL, self.on_field_changed)
         self.search_fields["MAX_RESULTS_PER_QUERY_DEFAULT"] = max_query_ctrl
         settings_grid.Add(max_query_ctrl, 0, wx.EXPAND)
         
         # Max results per provider
         settings_grid.Add(wx.StaticText(panel, label="Max Results Per Provider:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        max_provider_ctrl = wx.SpinCtrl(panel, value=str(self.settings.get("MAX_RESULTS_PER_PROVIDER_DEFAULT", 100)), min=1, max=1000, size=(100, -1))
+        max_provider_ctrl = wx.SpinCtrl(panel, min=1, max=1000, initial=int(self.settings.get("MAX_RESULTS_PER_PROVIDER_DEFAULT", 100)), size=(100, -1))
         max_provider_ctrl.Bind(wx.EVT_SPINCTRL, self.on_field_changed)
         self.search_fields["MAX_RESULTS_PER_PROVIDER_DEFAULT"] = max_provider_ctrl
         settings_grid.Add(max_provider_ctrl, 0, wx.EXPAND)
         
         # Sleep between requests
         settings_grid.Add(wx.StaticText(panel, label="Sleep Between Requests (sec):"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        sleep_ctrl = wx.SpinCtrlDouble(panel, value=str(self.settings.get("SLEEP_BETWEEN", 1.0)), min=0.0, max=10.0, inc=0.1, size=(100, -1))
+        sleep_ctrl = wx.SpinCtrlDouble(panel, min=0.0, max=10.0, initial=float(self.settings.get("SLEEP_BETWEEN", 1.0)), inc=0.1, size=(100, -1))
         sleep_ctrl.SetDigits(1)
         sleep_ctrl.Bind(wx.EVT_SPINCTRLDOUBLE, self.on_field_changed)
         self.search_fields["SLEEP_BETWEEN"] = sleep_ctrl
@@ -312,11 +401,9 @@ class SettingsWindow(wx.Frame):
         # OpenAI Tier
         embeddings_grid.Add(wx.StaticText(panel, label="OpenAI API Tier:"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
         
-        from model.TierInfo import get_tier_choices, get_choice_from_tier_id, get_tier_id_from_choice
-        
-        tier_choices = get_tier_choices()
+        tier_choices = list(_tier_tables()[0])
         current_tier_id = self.settings.get("OPENAI_TIER", "free")
-        current_tier_choice = get_choice_from_tier_id(current_tier_id)
+        current_tier_choice = _tier_choice_from_id(current_tier_id)
         
         tier_ctrl = wx.ComboBox(panel, value=current_tier_choice, choices=tier_choices, style=wx.CB_READONLY, size=(400, -1))
         tier_ctrl.Bind(wx.EVT_COMBOBOX, self.on_field_changed)
@@ -325,7 +412,7 @@ class SettingsWindow(wx.Frame):
         
         # Overhead per input
         embeddings_grid.Add(wx.StaticText(panel, label="Overhead Per Input (tokens):"), 0, wx.ALIGN_RIGHT | wx.ALIGN_CENTER_VERTICAL)
-        overhead_ctrl = wx.SpinCtrl(panel, value=str(self.settings.get("EMBEDDING_OVERHEAD_PER_INPUT", 150)), min=50, max=500, size=(100, -1))
+        overhead_ctrl = wx.SpinCtrl(panel, min=50, max=500, initial=int(self.settings.get("EMBEDDING_OVERHEAD_PER_INPUT", 150)), size=(100, -1))
         overhead_ctrl.Bind(wx.EVT_SPINCTRL, self.on_field_changed)
         overhead_ctrl.SetToolTip("Overhead tokens added per input for embeddings API (default: 150)")
         self.search_fields["EMBEDDING_OVERHEAD_PER_INPUT"] = overhead_ctrl
@@ -349,12 +436,21 @@ class SettingsWindow(wx.Frame):
         panel.SetSizer(sizer)
         return panel
     
+    def _on_toggle_visibility(self, event):
+        """Show/Hide button handler; the button carries its text control."""
+        button = event.GetEventObject()
+        self.toggle_visibility(button.text_ctrl, button)
+    
+    def _on_help_clicked(self, event):
+        """Get Key button handler; the button carries its help URL."""
+        webbrowser.open(event.GetEventObject().url)
+    
     def toggle_visibility(self, text_ctrl, button):
         """Toggle password visibility for API key fields."""
         if text_ctrl.is_visible:
             # Hide it - replace with dots
             text_ctrl.actual_value = text_ctrl.GetValue()
-            text_ctrl.ChangeValue("•" * len(text_ctrl.actual_value))
+            text_ctrl.ChangeValue(_dots(len(text_ctrl.actual_value)))
             text_ctrl.SetEditable(False)
             text_ctrl.is_visible = False
             button.SetLabel("Show")
@@ -376,12 +472,20 @@ class SettingsWindow(wx.Frame):
     
     def on_field_changed(self, event):
         """Mark settings as modified when any field changes."""
+        # Save button is already restyled; skip the repaint on every further keystroke
+        if self.modified:
+            return
         self.modified = True
         self.save_btn.SetBackgroundColour(wx.Colour(255, 200, 100))
         self.save_btn.SetLabel("Save Settings *")
     
     def on_save(self, event):
         """Save all settings."""
+        # Nothing changed since the last save; skip rewriting the file
+        if not self.modified:
+            wx.MessageBox("No changes to save.", "Settings", wx.OK | wx.ICON_INFORMATION)
+            return
+        
         # Collect all values
         new_settings = {}
         
@@ -389,36 +493,18 @@ class SettingsWindow(wx.Frame):
         for key, ctrl in self.api_key_fields.items():
             new_settings[key] = ctrl.actual_value
         
-        # Query defaults
-        for key, ctrl in self.query_fields.items():
-            if isinstance(ctrl, wx.SpinCtrl):
-                new_settings[key] = ctrl.GetValue()
-            elif isinstance(ctrl, wx.SpinCtrlDouble):
-                new_settings[key] = ctrl.GetValue()
-            elif isinstance(ctrl, wx.ComboBox):
-                new_settings[key] = ctrl.GetStringSelection()
-            else:
-                new_settings[key] = ctrl.GetValue()
-        
-        # Search settings
-        for key, ctrl in self.search_fields.items():
-            if isinstance(ctrl, wx.SpinCtrl):
-                new_settings[key] = ctrl.GetValue()
-            elif isinstance(ctrl, wx.SpinCtrlDouble):
-                new_settings[key] = ctrl.GetValue()
-            elif isinstance(ctrl, wx.ComboBox):
+        # Query defaults and search settings
+        for fields in (self.query_fields, self.search_fields):
+            for key, ctrl in fields.items():
+                getter = _GETTERS.get(type(ctrl))
+                value = getter(ctrl) if getter else ctrl.GetValue()
                 if key == "OPENAI_TIER":
                     # Convert choice to tier ID
-                    from model.TierInfo import get_tier_id_from_choice
-                    new_settings[key] = get_tier_id_from_choice(ctrl.GetStringSelection())
-                else:
-                    new_settings[key] = ctrl.GetStringSelection()
-            else:
-                new_settings[key] = ctrl.GetValue()
+                    value = _tier_id_from_choice(value)
+                new_settings[key] = value
         
         # Update and save
-        self.settings.update(new_settings)
-        if self.settings.save():
+        if self.settings.save(new_settings):
             wx.MessageBox("Settings saved successfully!", "Success", wx.OK | wx.ICON_INFORMATION)
             self.modified = False
             self.save_btn.SetBackgroundColour(wx.NullColour)
@@ -437,22 +523,53 @@ class SettingsWindow(wx.Frame):
         
         if dlg.ShowModal() == wx.ID_YES:
             # Reset to defaults
-            self.settings.update(Settings.DEFAULTS.copy())
-            self.settings.save()
+            self.settings.save(self.settings.DEFAULTS.copy())
             
-            # Reload UI
-            self.Close()
-            new_window = SettingsWindow(self.GetParent())
-            new_window.Show()
+            # Refresh the existing controls instead of rebuilding the window
+            wx.CallAfter(self._reload_values_from_settings)
         
         dlg.Destroy()
     
+    def _reload_values_from_settings(self):
+        """Repopulate all built controls from the current settings and clear the modified state."""
+        self.notebook.Freeze()
+        try:
+            # API Keys - keep each field's masked/visible state
+            for key, ctrl in self.api_key_fields.items():
+                value = self.settings.get(key, "")
+                ctrl.actual_value = value
+                ctrl.ChangeValue(value if ctrl.is_visible else _dots(len(value)))
+            
+            # Query defaults and search settings
+            for fields in (self.query_fields, self.search_fields):
+                for key, ctrl in fields.items():
+                    value = self.settings.get(key, self.settings.DEFAULTS.get(key))
+                    if key == "QUERY_DEFAULT_MODEL":
+                        if ctrl.GetCount():
+                            ctrl.SetSelection(_find_model_index(value))
+                    elif key == "OPENAI_TIER":
+                        ctrl.SetStringSelection(_tier_choice_from_id(value))
+                    elif isinstance(ctrl, wx.SpinCtrl):
+                        ctrl.SetValue(int(value))
+                    elif isinstance(ctrl, wx.SpinCtrlDouble):
+                        ctrl.SetValue(float(value))
+                    elif isinstance(ctrl, wx.ComboBox):
+                        ctrl.SetStringSelection(str(value))
+                    else:
+                        ctrl.ChangeValue(str(value))
+        finally:
+            self.notebook.Thaw()
+        
+        self.modified = False
+        self.save_btn.SetBackgroundColour(wx.NullColour)
+        self.save_btn.SetLabel("Save Settings")
+    
     def on_close(self, event):
         """Handle window close with unsaved changes check."""
         should_close = True
         
         # Clear singleton instance reference
-        SettingsWindow._instance = None
+        SettingsWindow._instance_ref = None
         
         if self.modified:
             dlg = wx.MessageDialog(
@@ -478,6 +595,6 @@ class SettingsWindow(wx.Frame):
 
 if __name__ == "__main__":
     app = wx.App()
-    window = SettingsWindow()
+    window = SettingsWindow(tab_index=0)
     window.Show()
     app.MainLoop()
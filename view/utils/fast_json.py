@@ -0,0 +1,56 @@
+"""
+Fast JSON parsing for files opened from the UI.
+
+Uses orjson or ujson when one is installed (C parsers, noticeably faster on large
+files) and falls back to the standard library json module otherwise.
+"""
+
+import json
+
+try:
+    import orjson as _backend
+except ImportError:
+    try:
+        import ujson as _backend
+    except ImportError:
+        _backend = None
+
+
+# Exceptions raised for malformed JSON by whichever parser is active
+# (orjson's error subclasses json.JSONDecodeError; ujson's is a plain ValueError subclass)
+if _backend is not None and hasattr(_backend, "JSONDecodeError"):
+    DECODE_ERRORS = (json.JSONDecodeError, _backend.JSONDecodeError)
+else:
+    DECODE_ERRORS = (json.JSONDecodeError,)
+
+
+def loads(data):
+    """
+    Parse JSON from bytes or str.
+
+    Args:
+        data: UTF-8 encoded bytes or a str containing JSON
+
+    Returns:
+        Parsed Python object
+    """
+    if _backend is not None:
+        return _backend.loads(data)
+    return json.loads(data)
+
+
+def load(path: str):
+    """
+    Read and parse a JSON file.
+
+    The file is read as raw bytes in one sized read (no text-layer decoding)
+    and the bytes go straight to the parser.
+
+    Args:
+        path: Path to a UTF-8 JSON file (str or os.PathLike)
+
+    Returns:
+        Parsed Python object
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
@@ -6,6 +6,17 @@ import os
 import wx
 
 
+# Path to icon.png in project root
+# Current file is in view/utils/, so go up 2 levels to reach project root
+_ICON_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "icon.png"
+)
+
+# Decoded icon, loaded on first use and shared by every window
+_ICON = None
+
+
 def set_window_icon(window):
     """
     Set the application icon for a window or dialog.
@@ -13,17 +24,18 @@ def set_window_icon(window):
     Args:
         window: wx.Frame or wx.Dialog instance
     """
-    # Get path to icon.png in project root
-    # Current file is in view/utils/, so go up 2 levels to reach project root
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    view_dir = os.path.dirname(current_dir)  # view/
-    project_root = os.path.dirname(view_dir)  # project root
-    icon_path = os.path.join(project_root, "icon.png")
-    
-    if os.path.exists(icon_path):
+    global _ICON
+    if _ICON is None:
+        if not os.path.exists(_ICON_PATH):
+            return
         try:
-            icon = wx.Icon(icon_path, wx.BITMAP_TYPE_PNG)
-            window.SetIcon(icon)
+            _ICON = wx.Icon(_ICON_PATH, wx.BITMAP_TYPE_PNG)
         except Exception as e:
             # Silently fail if icon cannot be loaded
-            pass
+            return
+    
+    try:
+        window.SetIcon(_ICON)
+    except Exception as e:
+        # Silently fail if icon cannot be set
+        pass
@@ -0,0 +1,53 @@
+"""
+Memoized lazy imports.
+
+Used for modules that cannot be imported at module scope (circular imports between
+windows) or that are too slow to import before they are actually needed.
+"""
+
+import importlib
+import threading
+
+
+def lazy(module_name: str, attr: str):
+    """
+    Get a callable that imports a module attribute on first call and caches it.
+
+    Args:
+        module_name: Dotted module name (e.g. "view.settings_window")
+        attr: Attribute to fetch from the module (e.g. "SettingsWindow")
+
+    Returns:
+        Zero-argument callable returning the attribute
+    """
+    cache = []
+
+    def resolve():
+        if not cache:
+            cache.append(getattr(importlib.import_module(module_name), attr))
+        return cache[0]
+
+    return resolve
+
+
+def prewarm(module_names) -> threading.Thread:
+    """
+    Import modules on a daemon thread so later imports are just sys.modules lookups.
+
+    Args:
+        module_names: Iterable of dotted module names
+
+    Returns:
+        The started thread
+    """
+    def _run():
+        for name in module_names:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                # Best effort only; the real import reports any error
+                pass
+
+    thread = threading.Thread(target=_run, name="glise-prewarm", daemon=True)
+    thread.start()
+    return thread
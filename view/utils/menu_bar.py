@@ -2,16 +2,79 @@
 Reusable menu bar component for all application windows.
 """
 
-import os
+import concurrent.futures
+import functools
+import pathlib
+import time
 import wx
-import json
-from typing import Optional
+from typing import ClassVar, Optional
+from view.utils import fast_json, parse_cache
+from view.utils.lazy_import import lazy, prewarm
 from view.utils.navigation_controller import get_navigation_controller
 
 
+# Imported on first use (windows import this module, so these cannot be imported at the top)
+_PromptWindow = lazy("view.generate_queries_form_window", "PromptWindow")
+_SettingsWindow = lazy("view.settings_window", "SettingsWindow")
+_ResultsWindow = lazy("view.results_window", "ResultsWindow")
+_SearchResultsWindow = lazy("view.search_results_window", "SearchResultsWindow")
+_QueryGeneration = lazy("model.QueryGeneration", "QueryGeneration")
+_SearchResults = lazy("model.SearchResults", "SearchResults")
+
+# Only needed when reporting an unexpected load error
+_print_exc = lazy("traceback", "print_exc")
+
+# Repeat activations of the same menu action within this many seconds are ignored
+_MENU_DEBOUNCE = 0.25
+
+# Modules behind the menu actions, imported in the background once the first menu bar exists
+_PREWARM_MODULES = (
+    "view.generate_queries_form_window",
+    "view.settings_window",
+    "view.results_window",
+    "view.search_results_window",
+    "model.QueryGeneration",
+    "model.SearchResults",
+)
+
+
+class _InvalidQueriesFile(Exception):
+    """Raised when a queries file parses but is not a usable queries object."""
+
+
 class AppMenuBar(wx.MenuBar):
     """Reusable menu bar for the Grey Literature Tool application."""
     
+    # Worker threads for parsing files opened from the menu, shared by all menu bars
+    _loader_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="glise-loader")
+    
+    # About box contents, built on first use and shared by all menu bars
+    _about_info = None
+    
+    _prewarm_started = False
+    
+    # (menu title, items); an item is (id, label, help, handler name, settings tab or None),
+    # None is a separator
+    _MENU_SPEC: ClassVar[tuple] = (
+        ("&File", (
+            (wx.ID_HOME, "Home\tCtrl+H", "Go to Query Generator", "_on_home", None),
+            None,
+            (wx.ID_ANY, "Open Queries...\tCtrl+O", "Open saved queries from JSON file", "_on_open_queries", None),
+            (wx.ID_ANY, "Open Search Results...\tCtrl+Shift+O", "Open saved search results from JSON file", "_on_open_search_results", None),
+            None,
+            (wx.ID_CLOSE, "Close Window\tCtrl+W", "Close current window", "_on_close_window", None),
+            (wx.ID_EXIT, "Exit All\tCtrl+Q", "Close all windows and exit application", "_on_exit_all", None),
+        )),
+        ("&Settings", (
+            (wx.ID_ANY, "API Keys\tCtrl+K", "Configure API keys for search providers", "_on_open_settings", 0),
+            (wx.ID_ANY, "Query Defaults\tCtrl+D", "Configure default query generation settings", "_on_open_settings", 1),
+            (wx.ID_ANY, "Search Settings\tCtrl+Shift+S", "Configure search execution settings", "_on_open_settings", 2),
+        )),
+        ("&Help", (
+            (wx.ID_ABOUT, "About", "About this application", "_on_about", None),
+        )),
+    )
+    
     def __init__(self, parent_window):
         """
         Initialize the menu bar.
@@ -21,62 +84,84 @@ class AppMenuBar(wx.MenuBar):
         """
         super().__init__()
         self.parent_window = parent_window
+        self._last_fire = {}  # Menu action -> monotonic time it last ran
+        self._dialogs = {}  # Dialog title -> reusable wx.FileDialog
         self._create_menus()
+        
+        # Import the windows behind the menu actions off the UI thread, once per process
+        if not AppMenuBar._prewarm_started:
+            AppMenuBar._prewarm_started = True
+            prewarm(_PREWARM_MODULES)
     
     def _create_menus(self):
-        """Create all menu items."""
-        # File menu
-        file_menu = wx.Menu()
-        
-        home_item = file_menu.Append(wx.ID_HOME, "Home\tCtrl+H", "Go to Query Generator")
-        self.parent_window.Bind(wx.EVT_MENU, self._on_home, home_item)
-        
-        file_menu.AppendSeparator()
-        
-        open_queries_item = file_menu.Append(wx.ID_ANY, "Open Queries...\tCtrl+O", "Open saved queries from JSON file")
-        self.parent_window.Bind(wx.EVT_MENU, self._on_open_queries, open_queries_item)
-        
-        open_results_item = file_menu.Append(wx.ID_ANY, "Open Search Results...\tCtrl+Shift+O", "Open saved search results from JSON file")
-        self.parent_window.Bind(wx.EVT_MENU, self._on_open_search_results, open_results_item)
-        
-        file_menu.AppendSeparator()
-        
-        close_item = file_menu.Append(wx.ID_CLOSE, "Close Window\tCtrl+W", "Close current window")
-        self.parent_window.Bind(wx.EVT_MENU, lambda evt: self.parent_window.Close(), close_item)
-        
-        exit_all_item = file_menu.Append(wx.ID_EXIT, "Exit All\tCtrl+Q", "Close all windows and exit application")
-        self.parent_window.Bind(wx.EVT_MENU, self._on_exit_all, exit_all_item)
-        
-        self.Append(file_menu, "&File")
-        
-        # Settings menu
-        settings_menu = wx.Menu()
+        """Create all menu items from _MENU_SPEC."""
+        bind = self.parent_window.Bind
+        for menu_title, items in self._MENU_SPEC:
+            menu = wx.Menu()
+            for spec in items:
+                if spec is None:
+                    menu.AppendSeparator()
+                    continue
+                item_id, label, help_text, handler_name, tab_index = spec
+                item = menu.Append(item_id, label, help_text)
+                handler = getattr(self, handler_name)
+                if tab_index is not None:
+                    handler = functools.partial(handler, tab_index=tab_index)
+                bind(wx.EVT_MENU, handler, item)
+            self.Append(menu, menu_title)
+    
+    def _on_close_window(self, event):
+        """Close the window this menu bar belongs to."""
+        self.parent_window.Close()
+    
+    def _debounced(self, action: str) -> bool:
+        """
+        Check whether a menu action fired too recently and should be ignored.
         
-        api_keys_item = settings_menu.Append(wx.ID_ANY, "API Keys\tCtrl+K", "Configure API keys for search providers")
-        self.parent_window.Bind(wx.EVT_MENU, lambda evt: self._on_open_settings(evt, 0), api_keys_item)
+        Guards against double-activations constructing the same window twice.
         
-        query_defaults_item = settings_menu.Append(wx.ID_ANY, "Query Defaults\tCtrl+D", "Configure default query generation settings")
-        self.parent_window.Bind(wx.EVT_MENU, lambda evt: self._on_open_settings(evt, 1), query_defaults_item)
+        Args:
+            action: Menu action identifier
+            
+        Returns:
+            True if the action ran less than _MENU_DEBOUNCE seconds ago
+        """
+        now = time.monotonic()
+        if now - self._last_fire.get(action, 0.0) < _MENU_DEBOUNCE:
+            return True
+        self._last_fire[action] = now
+        return False
+    
+    def _pick_json(self, title: str) -> Optional[str]:
+        """
+        Ask the user for a JSON file to open.
         
-        search_settings_item = settings_menu.Append(wx.ID_ANY, "Search Settings\tCtrl+Shift+S", "Configure search execution settings")
-        self.parent_window.Bind(wx.EVT_MENU, lambda evt: self._on_open_settings(evt, 2), search_settings_item)
+        The dialog is created once per title and reused, so the native file dialog
+        is only initialized the first time.
         
-        self.Append(settings_menu, "&Settings")
+        Args:
+            title: Dialog title
+            
+        Returns:
+            Selected path, or None if cancelled
+        """
+        dlg = self._dialogs.get(title)
+        if not dlg:
+            dlg = wx.FileDialog(self.parent_window, title,
+                                wildcard="JSON files (*.json)|*.json",
+                                style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+            self._dialogs[title] = dlg
+        else:
+            # Forget the previous selection but stay in the same directory
+            dlg.SetFilename("")
         
-        # Help menu
-        help_menu = wx.Menu()
-        about_item = help_menu.Append(wx.ID_ABOUT, "About", "About this application")
-        self.parent_window.Bind(wx.EVT_MENU, self._on_about, about_item)
-        self.Append(help_menu, "&Help")
+        if dlg.ShowModal() == wx.ID_CANCEL:
+            return None
+        return dlg.GetPath()
     
     def _on_home(self, event):
         """Navigate to home (Query Generator window)."""
-        from view.generate_queries_form_window import PromptWindow
-        from view.settings_window import SettingsWindow
-        from view.utils.navigation_controller import get_navigation_controller
-        
-        # Check if current window is already the home window
-        if isinstance(self.parent_window, PromptWindow):
+        if self._debounced('home'):
             return
         
         # Get navigation controller
@@ -84,6 +169,16 @@ class AppMenuBar(wx.MenuBar):
         
         # Check if home window already exists in stack
         home_win = nav.get_window_by_type('home')
+        
+        # Nothing to do if this menu bar belongs to home, or home is already in front
+        if home_win is not None and (home_win is self.parent_window or home_win is wx.GetActiveWindow()):
+            return
+        
+        # Fallback for a home window that is not registered in the stack
+        PromptWindow = _PromptWindow()
+        if isinstance(self.parent_window, PromptWindow):
+            return
+        
         if home_win:
             # Bring existing home to front
             nav.show_and_raise(home_win)
@@ -92,224 +187,280 @@ class AppMenuBar(wx.MenuBar):
             home_win = PromptWindow()
             nav.push(home_win, 'home', close_previous=False)
     
+    def _run_in_background(self, title: str, message: str, work, on_done, *args):
+        """
+        Run work(*args) on the loader pool while a pulsing progress dialog is shown.
+        
+        Args:
+            title: Progress dialog title
+            message: Progress dialog message
+            work: Callable run on a worker thread (must not touch wx)
+            on_done: Called on the UI thread as on_done(future, *args) once work finishes
+        """
+        progress = wx.ProgressDialog(title, message, parent=self.parent_window,
+                                     style=wx.PD_APP_MODAL | wx.PD_SMOOTH)
+        pulse_timer = wx.Timer(progress)
+        progress.Bind(wx.EVT_TIMER, lambda evt: progress.Pulse(), pulse_timer)
+        pulse_timer.Start(100)
+        
+        def finish(future):
+            pulse_timer.Stop()
+            progress.Destroy()
+            on_done(future, *args)
+        
+        future = self._loader_pool.submit(work, *args)
+        future.add_done_callback(lambda f: wx.CallAfter(finish, f))
+    
     def _on_open_queries(self, event):
         """Open queries from a JSON file."""
-        with wx.FileDialog(self.parent_window, "Open Queries File",
-                          wildcard="JSON files (*.json)|*.json",
-                          style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as fileDialog:
+        if self._debounced('open_queries'):
+            return
+        
+        pathname = self._pick_json("Open Queries File")
+        if pathname is None:
+            return
+        
+        # Check if file exists (single stat; directories are derived from the Path below)
+        path = pathlib.Path(pathname)
+        try:
+            path.stat()
+        except FileNotFoundError:
+            wx.MessageBox(f"File not found: {pathname}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+            return
+        except OSError as e:
+            # Unreadable file, permission denied, unreachable network path...
+            wx.MessageBox(f"Cannot access file: {pathname}\n\n{e}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+            return
+        
+        # Parse off the UI thread; the window is built in _finish_open_queries
+        self._run_in_background("Open Queries", "Loading queries file...",
+                                self._parse_queries, self._finish_open_queries, path)
+    
+    def _parse_queries(self, path: pathlib.Path):
+        """
+        Build a QueryGeneration from a queries file (runs on the loader pool).
+        
+        Raises:
+            _InvalidQueriesFile: If the file is not a non-empty JSON object
+        """
+        # Reuse the QueryGeneration built last time if neither file changed
+        info_path = path.parent / "info.json"
+        query_gen = parse_cache.get(path, info_path)
+        if query_gen is None:
+            data = fast_json.load(path)
             
-            if fileDialog.ShowModal() == wx.ID_CANCEL:
-                return
+            # Check if it's a valid format
+            if not isinstance(data, dict):
+                raise _InvalidQueriesFile("Invalid queries file format. Expected JSON object.")
             
-            pathname = fileDialog.GetPath()
-            try:
-                import os
-                
-                # Check if file exists
-                if not os.path.exists(pathname):
-                    wx.MessageBox(f"File not found: {pathname}",
-                                "Error", wx.OK | wx.ICON_ERROR)
-                    return
-                
-                with open(pathname, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                
-                # Check if it's a valid format
-                if not isinstance(data, dict):
-                    wx.MessageBox("Invalid queries file format. Expected JSON object.",
-                                "Error", wx.OK | wx.ICON_ERROR)
-                    return
-                
-                # Check if empty
-                if not data:
-                    wx.MessageBox("Queries file is empty.",
-                                "Error", wx.OK | wx.ICON_ERROR)
-                    return
-                
-                # Import here to avoid circular imports
-                from model.QueryGeneration import QueryGeneration
-                from view.results_window import ResultsWindow
+            # Check if empty
+            if not data:
+                raise _InvalidQueriesFile("Queries file is empty.")
+            
+            QueryGeneration = _QueryGeneration()
+            
+            # Determine format: check if it has 'results' key (full format) or just provider_id keys (queries-only format)
+            if 'results' in data:
+                # Full QueryGeneration format
+                query_gen = QueryGeneration(
+                    model=data.get('model', ''),
+                    system_prompt=data.get('system_prompt', ''),
+                    temperature=data.get('temperature', 0.7),
+                    intent=data.get('intent', ''),
+                    sources_ids=list(data['results'].keys()),
+                    languages=data.get('languages', ['all']),
+                    general_n=data.get('general_n', 10)
+                )
                 
-                # Determine format: check if it has 'results' key (full format) or just provider_id keys (queries-only format)
-                if 'results' in data:
-                    # Full QueryGeneration format
+                # Load the results
+                for source_id, queries in data['results'].items():
+                    query_gen.add_results(source_id, queries)
+            else:
+                # Simple queries-only format (queries.json)
+                # Try to load info.json from same directory if available
+                if info_path.is_file():
+                    # Load metadata from info.json
+                    info_data = fast_json.load(info_path)
+                    
                     query_gen = QueryGeneration(
-                        model=data.get('model', ''),
-                        system_prompt=data.get('system_prompt', ''),
-                        temperature=data.get('temperature', 0.7),
-                        intent=data.get('intent', ''),
-                        sources_ids=list(data['results'].keys()),
-                        languages=data.get('languages', ['all']),
-                        general_n=data.get('general_n', 10)
+                        model=info_data.get('model', 'Unknown Model'),
+                        system_prompt=info_data.get('system_prompt', ''),
+                        temperature=info_data.get('temperature', 0.7),
+                        intent=info_data.get('intent', ''),
+                        sources_ids=info_data.get('sources_ids', list(data.keys())),
+                        languages=info_data.get('languages', ['all']),
+                        general_n=info_data.get('general_n', 10)
                     )
-                    
-                    # Load the results
-                    for source_id, queries in data['results'].items():
-                        query_gen.add_results(source_id, queries)
+                    query_gen.instance_id = info_data.get('instance_id', path.parent.name)
                 else:
-                    # Simple queries-only format (queries.json)
-                    # Try to load info.json from same directory if available
-                    dir_path = os.path.dirname(pathname)
-                    info_path = os.path.join(dir_path, "info.json")
-                    
-                    if os.path.exists(info_path):
-                        # Load metadata from info.json
-                        with open(info_path, 'r', encoding='utf-8') as info_file:
-                            info_data = json.load(info_file)
-                        
-                        query_gen = QueryGeneration(
-                            model=info_data.get('model', 'Unknown Model'),
-                            system_prompt=info_data.get('system_prompt', ''),
-                            temperature=info_data.get('temperature', 0.7),
-                            intent=info_data.get('intent', ''),
-                            sources_ids=info_data.get('sources_ids', list(data.keys())),
-                            languages=info_data.get('languages', ['all']),
-                            general_n=info_data.get('general_n', 10)
-                        )
-                        query_gen.instance_id = info_data.get('instance_id', os.path.basename(dir_path))
-                    else:
-                        # No info.json, create with minimal data
-                        query_gen = QueryGeneration(
-                            model='Unknown',
-                            system_prompt='',
-                            temperature=0.7,
-                            intent='Loaded from queries file',
-                            sources_ids=list(data.keys()),
-                            languages=['all'],
-                            general_n=10
-                        )
-                    
-                    # Load queries from the simple format
-                    for source_id, queries in data.items():
-                        query_gen.add_results(source_id, queries)
+                    # No info.json, create with minimal data
+                    query_gen = QueryGeneration(
+                        model='Unknown',
+                        system_prompt='',
+                        temperature=0.7,
+                        intent='Loaded from queries file',
+                        sources_ids=list(data.keys()),
+                        languages=['all'],
+                        general_n=10
+                    )
                 
-                # Open results window with loaded queries
-                from view.utils.navigation_controller import get_navigation_controller
-                results_win = ResultsWindow(None, query_gen)
+                # Load queries from the simple format
+                for source_id, queries in data.items():
+                    query_gen.add_results(source_id, queries)
+            
+            parse_cache.put(path, query_gen, info_path)
+    
+        return query_gen
+    
+    def _finish_open_queries(self, future, path: pathlib.Path):
+        """Open a results window for the parsed queries, or report why parsing failed."""
+        try:
+            query_gen = future.result()
+            
+            # Open results window with loaded queries
+            results_win = _ResultsWindow()(None, query_gen)
 
-                # Record where this file was opened from so the UI can auto-save
-                try:
-                    dir_path = os.path.dirname(pathname)
-                    parent_dir = os.path.dirname(dir_path)
-                    folder_name = os.path.basename(dir_path)
-                    # Attach metadata used by the ResultsWindow to auto-save without prompting
-                    results_win._loaded_storage_parent = parent_dir
-                    results_win._loaded_folder_name = folder_name
-                except Exception:
-                    # Non-fatal: if we can't determine paths, fall back to prompting on save
-                    pass
+            # Record where this file was opened from so the UI can auto-save
+            try:
+                # Attach metadata used by the ResultsWindow to auto-save without prompting
+                results_win._loaded_storage_parent = str(path.parent.parent)
+                results_win._loaded_folder_name = path.parent.name
+            except Exception:
+                # Non-fatal: if we can't determine paths, fall back to prompting on save
+                pass
 
-                nav = get_navigation_controller()
-                nav.push(results_win, 'results', close_previous=False)
-                
-            except json.JSONDecodeError as e:
-                wx.MessageBox(f"Invalid JSON format in queries file:\n{str(e)}",
-                            "Error", wx.OK | wx.ICON_ERROR)
-            except FileNotFoundError as e:
-                wx.MessageBox(f"File not found:\n{str(e)}",
-                            "Error", wx.OK | wx.ICON_ERROR)
-            except KeyError as e:
-                wx.MessageBox(f"Missing required field in queries file:\n{str(e)}\n\nThe file may be corrupted or in an old format.",
-                            "Error", wx.OK | wx.ICON_ERROR)
-            except Exception as e:
-                wx.MessageBox(f"Error loading queries file:\n{str(e)}\n\nFile: {pathname}",
-                            "Error", wx.OK | wx.ICON_ERROR)
-                import traceback
-                traceback.print_exc()
+            nav = get_navigation_controller()
+            nav.push(results_win, 'results', close_previous=False)
+            
+        except _InvalidQueriesFile as e:
+            wx.MessageBox(str(e), "Error", wx.OK | wx.ICON_ERROR)
+        except fast_json.DECODE_ERRORS as e:
+            wx.MessageBox(f"Invalid JSON format in queries file:\n{str(e)}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+        except FileNotFoundError as e:
+            wx.MessageBox(f"File not found:\n{str(e)}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+        except KeyError as e:
+            wx.MessageBox(f"Missing required field in queries file:\n{str(e)}\n\nThe file may be corrupted or in an old format.",
+                        "Error", wx.OK | wx.ICON_ERROR)
+        except Exception as e:
+            wx.MessageBox(f"Error loading queries file:\n{str(e)}\n\nFile: {path}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+            _print_exc()()
     
     def _on_open_search_results(self, event):
         """Open search results from results.json file - SIMPLIFIED."""
+        if self._debounced('open_search_results'):
+            return
+        
         # Load from file
-        with wx.FileDialog(self.parent_window, "Open Search Results File (results.json)",
-                          wildcard="JSON files (*.json)|*.json",
-                          style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as fileDialog:
+        pathname = self._pick_json("Open Search Results File (results.json)")
+        if pathname is None:
+            return
+        
+        # Check if file exists (single stat; it also proves the instance and storage folders exist)
+        path = pathlib.Path(pathname)
+        try:
+            path.stat()
+        except FileNotFoundError:
+            wx.MessageBox(f"File not found: {pathname}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+            return
+        except OSError as e:
+            # Unreadable file, permission denied, unreachable network path...
+            wx.MessageBox(f"Cannot access file: {pathname}\n\n{e}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+            return
+        
+        # Get the instance_id from the directory name
+        instance_id = path.parent.name
+        
+        if not instance_id:
+            wx.MessageBox("Cannot determine instance ID from file path.",
+                        "Error", wx.OK | wx.ICON_ERROR)
+            return
+        
+        # storage_root is the parent of the instance folder
+        storage_root = str(path.parent.parent)
+        
+        # Load off the UI thread; the window is built in _finish_open_search_results
+        self._run_in_background("Open Search Results", "Loading search results...",
+                                self._load_search_results, self._finish_open_search_results,
+                                path, instance_id, storage_root)
+    
+    def _load_search_results(self, path: pathlib.Path, instance_id: str, storage_root: str):
+        """Load the SearchResults model behind a results.json file (runs on the loader pool)."""
+        # SIMPLE: Use SearchResults.load() to load everything
+        SearchResults = _SearchResults()
+        
+        # Load the complete model (includes all results + all filter metadata),
+        # reusing the one built last time if none of the instance's files changed
+        cache_deps = (path.parent / "info.json", path.parent / "queries.json")
+        search_results_model = parse_cache.get(path, *cache_deps)
+        if search_results_model is None:
+            search_results_model = SearchResults.load(instance_id, storage_root=storage_root, filter_model=None)
+            parse_cache.put(path, search_results_model, *cache_deps)
+        
+        return search_results_model
+    
+    def _finish_open_search_results(self, future, path: pathlib.Path, instance_id: str, storage_root: str):
+        """Open a search results window for the loaded model, or report why loading failed."""
+        try:
+            search_results_model = future.result()
             
-            if fileDialog.ShowModal() == wx.ID_CANCEL:
-                return
+            QueryGeneration = _QueryGeneration()
             
-            pathname = fileDialog.GetPath()
-            try:
-                # Check if file exists
-                if not os.path.exists(pathname):
-                    wx.MessageBox(f"File not found: {pathname}",
-                                "Error", wx.OK | wx.ICON_ERROR)
-                    return
-                
-                # Get the instance_id from the directory name
-                dir_path = os.path.dirname(pathname)
-                instance_id = os.path.basename(dir_path)
-                
-                if not instance_id:
-                    wx.MessageBox("Cannot determine instance ID from file path.",
-                                "Error", wx.OK | wx.ICON_ERROR)
-                    return
-                
-                # Check if storage_root exists (parent of instance folder)
-                storage_root = os.path.dirname(dir_path)
-                if not os.path.exists(storage_root):
-                    wx.MessageBox(f"Storage directory not found: {storage_root}",
-                                "Error", wx.OK | wx.ICON_ERROR)
-                    return
-                
-                # SIMPLE: Use SearchResults.load() to load everything
-                from model.SearchResults import SearchResults
-                from view.search_results_window import SearchResultsWindow
-                from model.QueryGeneration import QueryGeneration
-                
-                # Load the complete model (includes all results + all filter metadata)
-                search_results_model = SearchResults.load(instance_id, storage_root=storage_root, filter_model=None)
-                
-                # Create a QueryGeneration object for UI display
-                query_gen = QueryGeneration(
-                    model='',
-                    system_prompt='',
-                    temperature=0.2,
-                    intent=search_results_model.intent,
-                    sources_ids=search_results_model.providers,
-                    languages=['all'],
-                    general_n=10
-                )
-                query_gen.instance_id = search_results_model.query_generation_id
-                query_gen.results = search_results_model.queries
-                
-                # Show available filters info
-                available_filters = search_results_model.get_available_filters()
-                if available_filters:
-                    filter_info = f"\n\n📊 Available filters: {', '.join(available_filters)}"
-                else:
-                    filter_info = ""
-                
-                # Create window with the loaded results
-                from view.utils.navigation_controller import get_navigation_controller
-                results_win = SearchResultsWindow(None, search_results_model.results, query_gen)
-                results_win.storage_instance_id = instance_id
-                results_win.search_results_model = search_results_model  # Attach the model
+            # Create a QueryGeneration object for UI display
+            query_gen = QueryGeneration(
+                model='',
+                system_prompt='',
+                temperature=0.2,
+                intent=search_results_model.intent,
+                sources_ids=search_results_model.providers,
+                languages=['all'],
+                general_n=10
+            )
+            query_gen.instance_id = search_results_model.query_generation_id
+            query_gen.results = search_results_model.queries
+            
+            # Show available filters info
+            available_filters = search_results_model.get_available_filters()
+            if available_filters:
+                filter_info = f"\n\n📊 Available filters: {', '.join(available_filters)}"
+            else:
+                filter_info = ""
+            
+            # Create window with the loaded results
+            results_win = _SearchResultsWindow()(None, search_results_model.results, query_gen)
+            results_win.storage_instance_id = instance_id
+            results_win.search_results_model = search_results_model  # Attach the model
 
-                # Record storage location so Save can auto-write to the same place
-                try:
-                    # storage_root is the parent of the instance directory
-                    results_win._loaded_storage_parent = storage_root
-                    results_win._loaded_folder_name = instance_id
-                except Exception:
-                    pass
+            # Record storage location so Save can auto-write to the same place
+            try:
+                # storage_root is the parent of the instance directory
+                results_win._loaded_storage_parent = storage_root
+                results_win._loaded_folder_name = instance_id
+            except Exception:
+                pass
 
-                nav = get_navigation_controller()
-                nav.push(results_win, 'search_results', close_previous=False)
-                
-            except json.JSONDecodeError as e:
-                wx.MessageBox(f"Invalid JSON format in search results file:\n{str(e)}",
-                            "Error", wx.OK | wx.ICON_ERROR)
-            except FileNotFoundError as e:
-                wx.MessageBox(f"Required file not found:\n{str(e)}\n\nMake sure you're opening results.json from a complete search results folder.",
-                            "Error", wx.OK | wx.ICON_ERROR)
-            except KeyError as e:
-                wx.MessageBox(f"Missing required field in search results:\n{str(e)}\n\nThe file may be corrupted or in an old format.",
-                            "Error", wx.OK | wx.ICON_ERROR)
-            except Exception as e:
-                wx.MessageBox(f"Error loading search results file:\n{str(e)}\n\nFile: {pathname}",
-                            "Error", wx.OK | wx.ICON_ERROR)
-                import traceback
-                traceback.print_exc()
+            nav = get_navigation_controller()
+            nav.push(results_win, 'search_results', close_previous=False)
+            
+        except fast_json.DECODE_ERRORS as e:
+            wx.MessageBox(f"Invalid JSON format in search results file:\n{str(e)}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+        except FileNotFoundError as e:
+            wx.MessageBox(f"Required file not found:\n{str(e)}\n\nMake sure you're opening results.json from a complete search results folder.",
+                        "Error", wx.OK | wx.ICON_ERROR)
+        except KeyError as e:
+            wx.MessageBox(f"Missing required field in search results:\n{str(e)}\n\nThe file may be corrupted or in an old format.",
+                        "Error", wx.OK | wx.ICON_ERROR)
+        except Exception as e:
+            wx.MessageBox(f"Error loading search results file:\n{str(e)}\n\nFile: {path}",
+                        "Error", wx.OK | wx.ICON_ERROR)
+            _print_exc()()
     
     def _on_open_settings(self, event, tab_index: int = 0):
         """
@@ -319,22 +470,17 @@ class AppMenuBar(wx.MenuBar):
             event: The menu event
             tab_index: The index of the tab to select (0=API Keys, 1=Query Defaults, 2=Search Settings)
         """
-        from view.settings_window import SettingsWindow
-        from view.generate_queries_form_window import PromptWindow
+        if self._debounced('settings'):
+            return
+        
+        SettingsWindow = _SettingsWindow()
         
         # Check if current window is already the settings window
         if isinstance(self.parent_window, SettingsWindow):
             # Just switch to the requested tab
-            if hasattr(self.parent_window, 'notebook'):
-                notebook = None
-                for child in self.parent_window.GetChildren():
-                    if isinstance(child, wx.Panel):
-                        for panel_child in child.GetChildren():
-                            if isinstance(panel_child, wx.Notebook):
-                                notebook = panel_child
-                                break
-                if notebook and 0 <= tab_index < notebook.GetPageCount():
-                    notebook.SetSelection(tab_index)
+            notebook = getattr(self.parent_window, 'notebook', None)
+            if notebook and 0 <= tab_index < notebook.GetPageCount():
+                notebook.SetSelection(tab_index)
             return
         
         # Settings window uses singleton pattern
@@ -350,9 +496,13 @@ class AppMenuBar(wx.MenuBar):
     
     def _on_about(self, event):
         """Show about dialog."""
-        info = wx.adv.AboutDialogInfo()
-        info.SetName("GLiSE - Grey Literature Search Engine")
-        info.SetVersion("1.0.0")
-        info.SetDescription("Generate optimized search queries for grey literature research across multiple platforms.")
-        info.SetWebSite("https://github.com/anonymous10112025-prog/GLiSE")
-        wx.adv.AboutBox(info)
+        import wx.adv
+        
+        if AppMenuBar._about_info is None:
+            info = wx.adv.AboutDialogInfo()
+            info.SetName("GLiSE - Grey Literature Search Engine")
+            info.SetVersion("1.0.0")
+            info.SetDescription("Generate optimized search queries for grey literature research across multiple platforms.")
+            info.SetWebSite("https://github.com/anonymous10112025-prog/GLiSE")
+            AppMenuBar._about_info = info
+        wx.adv.AboutBox(AppMenuBar._about_info)
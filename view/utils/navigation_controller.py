@@ -6,7 +6,8 @@ Eliminates the need for manual flags, race conditions, and complex close handler
 """
 
 import wx
-from typing import Optional, List, Tuple
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
 
 
 class NavigationController:
@@ -35,7 +36,12 @@ class NavigationController:
             return
         
         self._initialized = True
-        self.stack: List[Tuple[wx.Frame, str]] = []  # [(window, window_type)]
+        # id(window) -> (window, window_type), bottom of the stack first
+        self.stack: "OrderedDict[int, Tuple[wx.Frame, str]]" = OrderedDict()
+        # window_type -> windows of that type in stack order (for get_window_by_type)
+        self._by_type: Dict[str, List[wx.Frame]] = defaultdict(list)
+        # Windows replaced by push(), destroyed together by one queued _flush_destroy
+        self._pending_destroy: List[wx.Frame] = []
         self.app: Optional[wx.App] = None
     
     def set_app(self, app: wx.App):
@@ -59,7 +65,11 @@ class NavigationController:
         """
         # Add to stack FIRST before closing previous
         # This ensures stack is never empty during transition
-        self.stack.append((window, window_type))
+        if id(window) in self.stack:
+            self._remove(id(window))
+        self.stack[id(window)] = (window, window_type)
+        self._by_type[window_type].append(window)
+        self.stack.move_to_end(id(window))
         
         # Show and bring to front
         self._show_and_raise(window)
@@ -70,14 +80,49 @@ class NavigationController:
         # Close previous window if linear navigation (AFTER adding new window)
         if close_previous and len(self.stack) > 1:
             # Get the previous window (second to last)
-            previous_window, _ = self.stack[-2]
-            try:
-                # Remove previous window from stack first
-                self.stack = [(w, t) for w, t in self.stack if w != previous_window]
-                # Then destroy it
-                wx.CallAfter(previous_window.Destroy)
-            except:
-                pass
+            keys = reversed(self.stack)
+            next(keys)
+            previous_key = next(keys)
+            # Remove previous window from stack first
+            previous_window = self._remove(previous_key)
+            # Then destroy it (batched with any other pending destroys)
+            if previous_window is not None:
+                if not self._pending_destroy:
+                    wx.CallAfter(self._flush_destroy)
+                self._pending_destroy.append(previous_window)
+    
+    def _flush_destroy(self):
+        """Destroy every window queued by push() since the last flush."""
+        pending, self._pending_destroy = self._pending_destroy, []
+        for window in pending:
+            self._destroy(window)
+    
+    @staticmethod
+    def _destroy(window: wx.Frame):
+        """Destroy a window unless its C++ side is already gone."""
+        # Destroyed wx windows are falsy, so the common destroyed-twice case never raises
+        if not window:
+            return
+        try:
+            window.Destroy()
+        except RuntimeError:
+            pass
+    
+    def _remove(self, key: int) -> Optional[wx.Frame]:
+        """Remove a window from the stack and the type index; returns it (None if absent)."""
+        entry = self.stack.pop(key, None)
+        if entry is None:
+            return None
+        window, window_type = entry
+        wins = self._by_type.get(window_type)
+        if wins:
+            for i in range(len(wins) - 1, -1, -1):
+                if wins[i] is window:
+                    del wins[i]
+                    break
+            if not wins:
+                del self._by_type[window_type]
+        return window
     
     def _show_and_raise(self, window: wx.Frame):
         """Show a window and bring it to front."""
@@ -103,16 +148,13 @@ class NavigationController:
             return
         
         # Get and remove current window
-        current_window, _ = self.stack.pop()
+        current_window = self._remove(next(reversed(self.stack)))
         
-        try:
-            current_window.Destroy()
-        except:
-            pass
+        self._destroy(current_window)
         
         # Show previous window if exists
         if self.stack:
-            previous_window, _ = self.stack[-1]
+            previous_window = self.get_current()
             self._show_and_raise(previous_window)
     
     def _on_window_close(self, event, window, window_type):
@@ -121,7 +163,7 @@ class NavigationController:
         Automatically removes window from stack and exits app if no windows remain.
         """
         # Remove from stack
-        self.stack = [(w, t) for w, t in self.stack if w != window]
+        self._remove(id(window))
         
         # If no windows left, exit app
         if not self.stack:
@@ -134,17 +176,15 @@ class NavigationController:
     def close_all(self):
         """Close all windows and exit application."""
         # Get all windows as a list
-        all_windows = [window for window, _ in list(self.stack)]
+        all_windows = [window for window, _ in self.stack.values()]
         
         # Close all windows
         for window in all_windows:
-            try:
-                window.Destroy()
-            except:
-                pass
+            self._destroy(window)
         
         # Clear stack
         self.stack.clear()
+        self._by_type.clear()
         
         # Exit application
         if self.app:
@@ -152,17 +192,15 @@ class NavigationController:
     
     def get_current(self) -> Optional[wx.Frame]:
         """Get the current (top) window in the stack."""
-        return self.stack[-1][0] if self.stack else None
+        return next(reversed(self.stack.values()))[0] if self.stack else None
     
     def get_window_by_type(self, window_type: str) -> Optional[wx.Frame]:
         """
         Get a window by its type identifier.
         Returns the most recent window of that type.
         """
-        for window, wtype in reversed(self.stack):
-            if wtype == window_type:
-                return window
-        return None
+        wins = self._by_type.get(window_type)
+        return wins[-1] if wins else None
     
     def get_count(self) -> int:
         """Get number of windows in the navigation stack."""
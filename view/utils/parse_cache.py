@@ -0,0 +1,117 @@
+"""
+On-disk cache of objects built from JSON files opened in the UI.
+
+Entries are pickles under ~/.cache/glise/, keyed by _CACHE_VERSION and the absolute
+path, modification time and size of every source file involved, so editing or
+replacing any of them simply misses the cache. Entries not used for a month are pruned.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "glise")
+_MAX_AGE_SECONDS = 30 * 24 * 3600
+
+# Bump whenever a cached class (SearchResults, QueryGeneration) gains, loses or renames
+# attributes, so pickles written by older code are never loaded
+_CACHE_VERSION = 2
+_pruned = False
+
+
+def _entry_path(path: str, related) -> str:
+    """
+    Cache file for `path` plus its related files.
+
+    Raises OSError if `path` itself cannot be stat'ed; missing related files are
+    part of the key (so creating one later invalidates the entry).
+    """
+    parts = [f"v{_CACHE_VERSION}"]
+    for i, source in enumerate((path,) + tuple(related)):
+        source = os.path.abspath(source)
+        try:
+            st = os.stat(source)
+        except FileNotFoundError:
+            if i == 0:
+                raise
+            parts.append(f"{source}|-")
+            continue
+        parts.append(f"{source}|{st.st_mtime_ns}|{st.st_size}")
+    digest = hashlib.blake2b("\n".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(_CACHE_DIR, digest + ".pkl")
+
+
+def get(path: str, *related):
+    """
+    Get the cached object for a source file.
+
+    Args:
+        path: Source file the object was built from
+        *related: Other files the object was built from (e.g. a sibling info.json)
+
+    Returns:
+        The cached object, or None on a miss or unreadable entry (which is deleted)
+    """
+    try:
+        entry = _entry_path(path, related)
+    except OSError:
+        return None
+    try:
+        with open(entry, "rb") as f:
+            obj = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Corrupt or written by incompatible code (unpickling/attribute errors): drop it
+        try:
+            os.remove(entry)
+        except OSError:
+            pass
+        return None
+    try:
+        # Mark as recently used so prune() keeps it
+        os.utime(entry)
+    except OSError:
+        pass
+    return obj
+
+
+def put(path: str, obj, *related):
+    """
+    Cache an object built from a source file. Failures are silently ignored.
+
+    Args:
+        path: Source file the object was built from
+        obj: Picklable object to cache
+        *related: Other files the object was built from
+    """
+    global _pruned
+    try:
+        entry = _entry_path(path, related)
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        if not _pruned:
+            _pruned = True
+            prune()
+        tmp_path = f"{entry}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry)
+    except Exception:
+        pass
+
+
+def prune(max_age: float = _MAX_AGE_SECONDS):
+    """Remove cache entries that have not been used for `max_age` seconds."""
+    cutoff = time.time() - max_age
+    try:
+        with os.scandir(_CACHE_DIR) as it:
+            for dir_entry in it:
+                try:
+                    if dir_entry.stat().st_mtime < cutoff:
+                        os.remove(dir_entry.path)
+                except OSError:
+                    pass
+    except OSError:
+        pass
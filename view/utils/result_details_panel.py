@@ -3,10 +3,53 @@ Result Details Panel - Side panel for displaying individual search result detail
 Shows all fields of a selected result in a scrollable form with proper formatting.
 """
 
+import re
 import wx
 import wx.html
 import webbrowser
 from typing import Dict, Optional
+from model.providers import get_provider_or_none
+
+
+# Display labels for the usual result fields (others are derived from the field name)
+_FIELD_LABELS = {
+    'source': 'Source',
+    'search_query': 'Search Query',
+    'title': 'Title',
+    'url': 'URL',
+    'snippet': 'Snippet',
+    'body': 'Body',
+    'description': 'Description',
+    'html_snippet': 'Html Snippet',
+}
+
+# Internal/technical result fields that are never displayed
+_SKIP_FIELDS = frozenset({'relevant', 'relevant_score', 'relevant_proba', '_original_index', '_filters', 'search_intent'})
+
+# Fields whose values may contain HTML
+_HTML_FIELDS = frozenset({'snippet', 'body', 'description', 'html_snippet'})
+
+# Opening tags that mark a field value as HTML
+_HTML_TAG_RE = re.compile(r'<(?:p|div|span|a|code|pre)>', re.IGNORECASE)
+
+# Page wrapped around HTML field content (single %s substitution)
+_HTML_TEMPLATE = '<html><body style="font-family: Arial, sans-serif; font-size: 10pt;">%s</body></html>'
+
+# Long text fields show this many characters at first, and this many more per "Show more"
+_LONG_TEXT_CHUNK = 10_000
+
+# Heights reserved for heavy field widgets until they are scrolled into view
+# (HtmlWindow / multiline TextCtrl plus their borders and copy button)
+_HTML_FIELD_HEIGHT = 210
+_LONG_TEXT_FIELD_HEIGHT = 195
+
+
+class _PlaceholderPanel(wx.Panel):
+    """Empty fixed-height stand-in for a field widget that has not been built yet."""
+    
+    def __init__(self, parent, height: int):
+        super().__init__(parent)
+        self.SetMinSize((-1, height))
 
 
 class ResultDetailsPanel(wx.Panel):
@@ -15,6 +58,14 @@ class ResultDetailsPanel(wx.Panel):
     Handles different field types (text, HTML, URLs) appropriately.
     """
     
+    # Provider ID -> display name (the raw ID for unknown providers), shared by all panels
+    _provider_name_cache: Dict[str, str] = {}
+    
+    # Colours and fonts shared by all panels, created by the first panel (needs a live wx.App)
+    _BG_LIGHT: Optional[wx.Colour] = None
+    _FG_GREY: Optional[wx.Colour] = None
+    _HEADER_FONT: Optional[wx.Font] = None
+    
     def __init__(self, parent):
         """
         Initialize the details panel.
@@ -24,21 +75,43 @@ class ResultDetailsPanel(wx.Panel):
         """
         super().__init__(parent)
         
+        if ResultDetailsPanel._BG_LIGHT is None:
+            ResultDetailsPanel._BG_LIGHT = wx.Colour(250, 250, 250)
+            ResultDetailsPanel._FG_GREY = wx.Colour(128, 128, 128)
+        
         self.current_result = None
         
+        # Field rows kept across selections, keyed by field name. Each row is a dict:
+        # box (StaticBoxSizer), kind ('url', 'html', 'long' or 'short'), value, widgets
+        # (tuple returned by the kind's builder, None while still a placeholder),
+        # slot and placeholder (deferred kinds only)
+        self._field_rows = {}
+        
+        # Rows of heavy kinds whose widgets have not been built yet
+        self._pending_fields = []
+        
+        # "Select a result" hint, while shown
+        self._empty_msg = None
+        
+        # A deferred _do_layout is queued (the scrolled area stays frozen until it runs)
+        self._layout_pending = False
+        
         # Create scrolled window for the content
         self.scroll = wx.ScrolledWindow(self)
         self.scroll.SetScrollRate(10, 10)
+        self.scroll.Bind(wx.EVT_SCROLLWIN, self._on_scroll)
+        self.scroll.Bind(wx.EVT_SIZE, self._on_scroll)
         
         # Main sizer
         main_sizer = wx.BoxSizer(wx.VERTICAL)
         
         # Header
         header_label = wx.StaticText(self, label="Result Details")
-        header_font = header_label.GetFont()
-        header_font.PointSize += 2
-        header_font = header_font.Bold()
-        header_label.SetFont(header_font)
+        if ResultDetailsPanel._HEADER_FONT is None:
+            header_font = header_label.GetFont()
+            header_font.PointSize += 2
+            ResultDetailsPanel._HEADER_FONT = header_font.Bold()
+        header_label.SetFont(self._HEADER_FONT)
         main_sizer.Add(header_label, 0, wx.ALL, 10)
         
         # Separator
@@ -64,17 +137,26 @@ class ResultDetailsPanel(wx.Panel):
         # Show initial message
         self._show_empty_message()
     
-    def _show_empty_message(self):
-        """Show message when no result is selected."""
+    def _show_empty_message(self, layout: bool = True):
+        """
+        Show message when no result is selected.
+        
+        Args:
+            layout: Lay out the scrolled area now (False when the caller lays it out itself)
+        """
         self.content_sizer.Clear(True)
+        self._field_rows = {}
+        self._pending_fields = []
         
         msg = wx.StaticText(self.scroll, 
                            label="Select a result from the table\nto view details here.")
-        msg.SetForegroundColour(wx.Colour(128, 128, 128))
+        msg.SetForegroundColour(self._FG_GREY)
+        self._empty_msg = msg
         
         self.content_sizer.Add(msg, 0, wx.ALL | wx.ALIGN_CENTER, 20)
-        self.scroll.Layout()
-        self.scroll.FitInside()
+        if layout:
+            self.scroll.Layout()
+            self.scroll.FitInside()
     
     def display_result(self, result: Dict):
         """
@@ -83,107 +165,264 @@ class ResultDetailsPanel(wx.Panel):
         Args:
             result: Dictionary containing result data
         """
+        # Suppress repaints while rows are rebuilt; a burst of selections (e.g. arrowing
+        # through the table) is laid out and painted once, when the event queue drains
+        if not self._layout_pending:
+            self._layout_pending = True
+            self.scroll.Freeze()
+            wx.CallAfter(self._do_layout)
+        
         if not result:
-            self._show_empty_message()
+            self._show_empty_message(layout=False)
+        else:
+            self._build_fields(result)
+    
+    def _do_layout(self):
+        """Lay out the rows queued by display_result and unfreeze the scrolled area."""
+        if not self:
             return
+        self._layout_pending = False
+        try:
+            self.scroll.Layout()
+            self.scroll.FitInside()
+            # Build the heavy widgets that are visible straight away
+            self._realize_visible()
+        finally:
+            self.scroll.Thaw()
+    
+    def _build_fields(self, result: Dict):
+        """
+        Show one row per displayable field of `result`.
         
+        Rows of the previous result are reused when the same field has the same kind
+        (only their values change); rows of fields this result lacks are hidden.
+        """
         self.current_result = result
         self.copy_all_btn.Enable(True)
         
-        # Clear previous content
-        self.content_sizer.Clear(True)
+        if self._empty_msg is not None:
+            self.content_sizer.Clear(True)
+            self._empty_msg = None
         
-        # Define field display order and special handling
-        html_fields = ['snippet', 'body', 'description', 'html_snippet']
+        # Field rows to show, in display order
+        rows = []
         
         # Display in specific order: source, search_query, url, then rest
         displayed_fields = set()
         
         # 1. Source (first) - Convert provider ID to name
         if 'source' in result:
-            source_value = result['source']
-            # Try to get provider name from ID
-            try:
-                from model.providers import get_provider
-                provider = get_provider(source_value)
-                source_value = provider.name
-            except:
-                # If provider lookup fails, use the raw value
-                pass
-            self._add_field('source', source_value)
+            source_value = self._provider_name(result['source'])
+            rows.append(self._add_field('source', source_value))
             displayed_fields.add('source')
         
         # 2. Search Query (second)
         if 'search_query' in result:
-            self._add_field('search_query', result['search_query'])
+            rows.append(self._add_field('search_query', result['search_query']))
             displayed_fields.add('search_query')
         
         # 3. Title (third)
         if 'title' in result:
-            self._add_field('title', result['title'])
+            rows.append(self._add_field('title', result['title']))
             displayed_fields.add('title')
         
         # 4. URL (fourth)
         if 'url' in result:
-            self._add_field('url', result['url'])
+            rows.append(self._add_field('url', result['url']))
             displayed_fields.add('url')
         
         # 5. Content fields (snippet, body, description)
         for field in ['snippet', 'body', 'description']:
             if field in result:
-                self._add_field(field, result[field], is_html_field=(field in html_fields))
+                rows.append(self._add_field(field, result[field], is_html_field=(field in _HTML_FIELDS)))
                 displayed_fields.add(field)
         
-        # 6. Display remaining fields
-        for field, value in sorted(result.items()):
+        # 6. Display remaining fields (in the result's own key order)
+        for field, value in result.items():
             if field not in displayed_fields:
-                self._add_field(field, value, is_html_field=(field in html_fields))
-        
-        self.scroll.Layout()
-        self.scroll.FitInside()
+                rows.append(self._add_field(field, value, is_html_field=(field in _HTML_FIELDS)))
+        
+        rows = [row for row in rows if row is not None]
+        shown = {id(row) for row in rows}
+        hidden = [row for row in self._field_rows.values() if id(row) not in shown]
+        
+        # Take every row out of the sizer (without destroying it) and re-add in display order
+        for row in self._field_rows.values():
+            self.content_sizer.Detach(row['box'])
+        self.content_sizer.AddMany([(row['box'], 0, wx.EXPAND | wx.ALL, 5) for row in rows + hidden])
+        for row in rows:
+            self.content_sizer.Show(row['box'], True, recursive=True)
+        for row in hidden:
+            self.content_sizer.Show(row['box'], False, recursive=True)
+    
+    @classmethod
+    def _provider_name(cls, provider_id) -> str:
+        """Get a provider's display name from its ID, falling back to the ID itself."""
+        name = cls._provider_name_cache.get(provider_id)
+        if name is None:
+            provider = get_provider_or_none(provider_id)
+            name = provider.name if provider else provider_id
+            cls._provider_name_cache[provider_id] = name
+        return name
     
     def _add_field(self, field_name: str, field_value, is_html_field: bool = False):
         """
-        Add a field to the details panel.
+        Get the row for a field of the details panel, reusing the field's existing row
+        if it has the same kind and building a new one otherwise.
         
         Args:
             field_name: Name of the field
             field_value: Value of the field
             is_html_field: Whether this field contains HTML
+            
+        Returns:
+            The field's row (for the caller to add to content_sizer), or None if skipped
         """
         # Skip internal/technical fields that should not be displayed
-        skip_fields = ['relevant', 'relevant_score', 'relevant_proba', '_original_index', '_filters', 'search_intent']
-        if field_name in skip_fields:
-            return
+        if field_name in _SKIP_FIELDS:
+            return None
         
         if field_value is None or (isinstance(field_value, str) and not field_value.strip()):
-            return
+            return None
+        
+        # Handle different field types
+        if field_name == 'url':
+            kind, value = 'url', field_value
+        else:
+            # Convert once; large bodies are not copied again for each check below
+            text = field_value if isinstance(field_value, str) else str(field_value)
+            if is_html_field and self._is_html_content(text):
+                kind, value = 'html', text
+            elif len(text) > 100:  # Long text
+                kind, value = 'long', text
+            else:  # Short text
+                kind, value = 'short', text
+        
+        row = self._field_rows.get(field_name)
+        if row is not None and row['kind'] == kind:
+            self._update_row(row, value)
+            return row
+        if row is not None:
+            self._destroy_row(row)
         
         # Create field container
         field_box = wx.StaticBoxSizer(wx.VERTICAL, self.scroll, self._format_field_name(field_name))
+        row = {'box': field_box, 'kind': kind, 'value': value, 'widgets': None}
+        
+        if kind == 'url':
+            row['widgets'] = self._add_url_field(field_box, value)
+        elif kind == 'html':
+            self._add_deferred_field(row, _HTML_FIELD_HEIGHT)
+        elif kind == 'long':
+            self._add_deferred_field(row, _LONG_TEXT_FIELD_HEIGHT)
+        else:
+            row['widgets'] = self._add_short_text_field(field_box, value)
+        
+        self._field_rows[field_name] = row
+        return row
+    
+    def _update_row(self, row: dict, value):
+        """Show a new value in an existing field row of the same kind."""
+        row['value'] = value
+        widgets = row['widgets']
+        if widgets is None:
+            # Still a placeholder; it is built with the new value when it scrolls into view
+            return
         
-        # Handle different field types
-        if field_name == 'url':
-            self._add_url_field(field_box, field_value)
-        elif is_html_field and self._is_html_content(str(field_value)):
-            self._add_html_field(field_box, str(field_value))
-        elif len(str(field_value)) > 100:  # Long text
-            self._add_long_text_field(field_box, str(field_value))
-        else:  # Short text
-            self._add_short_text_field(field_box, str(field_value))
-        
-        self.content_sizer.Add(field_box, 0, wx.EXPAND | wx.ALL, 5)
+        kind = row['kind']
+        if kind == 'url':
+            url_text, copy_btn, open_btn = widgets
+            url_text.SetLabel(value)
+            url_text.SetURL(value)
+            copy_btn.SetClientData(value)
+            open_btn.SetClientData(value)
+        elif kind == 'html':
+            widgets[0].SetPage(self._wrap_html(value))
+        elif kind == 'long':
+            text_ctrl, copy_btn, more_btn = widgets
+            self._set_long_text(text_ctrl, more_btn, value)
+            copy_btn.SetClientData(value)
+        else:
+            widgets[0].ChangeValue(value)
+    
+    def _destroy_row(self, row: dict):
+        """Destroy a field row's widgets and sizer (which also deletes its static box)."""
+        row['box'].Clear(True)
+        self.content_sizer.Remove(row['box'])
+    
+    def _add_deferred_field(self, row: dict, height: int):
+        """
+        Reserve space for a heavy field widget and build it once it scrolls into view.
+        
+        Args:
+            row: New 'html' or 'long' field row
+            height: Estimated height of the real widget
+        """
+        slot = wx.BoxSizer(wx.VERTICAL)
+        placeholder = _PlaceholderPanel(self.scroll, height)
+        slot.Add(placeholder, 1, wx.EXPAND)
+        row['box'].Add(slot, 1, wx.EXPAND)
+        row['slot'] = slot
+        row['placeholder'] = placeholder
+        self._pending_fields.append(row)
+    
+    def _on_scroll(self, event):
+        """Build placeholders that scrolled (or resized) into view."""
+        event.Skip()
+        if self._pending_fields:
+            # The view start only changes after the default handler has run
+            wx.CallAfter(self._realize_visible)
+    
+    def _realize_visible(self):
+        """Replace the placeholders intersecting the visible area with their real widgets."""
+        if not self._pending_fields or not self:
+            return
+        
+        # Visible range in virtual (unscrolled) coordinates
+        _, ppu_y = self.scroll.GetScrollPixelsPerUnit()
+        view_top = self.scroll.GetViewStart()[1] * ppu_y
+        view_bottom = view_top + self.scroll.GetClientSize().height
+        
+        remaining = []
+        realized = False
+        for row in self._pending_fields:
+            placeholder = row['placeholder']
+            if not placeholder:
+                # Row was destroyed before it was ever shown
+                continue
+            if not placeholder.IsShown():
+                # Row is hidden (field absent from the current result)
+                remaining.append(row)
+                continue
+            rect = placeholder.GetRect()
+            top = self.scroll.CalcUnscrolledPosition(rect.GetPosition()).y
+            if top <= view_bottom and top + rect.height >= view_top:
+                if not realized:
+                    self.scroll.Freeze()
+                    realized = True
+                row['slot'].Clear(True)
+                row['placeholder'] = None
+                builder = self._add_html_field if row['kind'] == 'html' else self._add_long_text_field
+                row['widgets'] = builder(row['slot'], row['value'])
+            else:
+                remaining.append(row)
+        self._pending_fields = remaining
+        
+        if realized:
+            self.scroll.Layout()
+            self.scroll.FitInside()
+            self.scroll.Thaw()
     
     def _format_field_name(self, field_name: str) -> str:
         """Format field name for display."""
-        return field_name.replace('_', ' ').title()
+        return _FIELD_LABELS.get(field_name) or field_name.replace('_', ' ').title()
     
     def _is_html_content(self, text: str) -> bool:
         """Check if text contains HTML tags."""
-        return '<' in text and '>' in text and any(tag in text.lower() for tag in ['<p>', '<div>', '<span>', '<a>', '<code>', '<pre>'])
+        return _HTML_TAG_RE.search(text) is not None
     
     def _add_url_field(self, sizer: wx.StaticBoxSizer, url: str):
-        """Add URL field with open and copy buttons."""
+        """Add URL field with open and copy buttons; returns (link, copy button, open button)."""
         url_sizer = wx.BoxSizer(wx.HORIZONTAL)
         
         # URL text (clickable)
@@ -192,54 +431,103 @@ class ResultDetailsPanel(wx.Panel):
         
         # Copy button
         copy_btn = wx.Button(self.scroll, label="Copy", size=(60, -1))
-        copy_btn.Bind(wx.EVT_BUTTON, lambda evt: self._copy_to_clipboard(url))
+        copy_btn.SetClientData(url)
+        copy_btn.Bind(wx.EVT_BUTTON, self._on_copy_btn)
         url_sizer.Add(copy_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 2)
         
         # Open button
         open_btn = wx.Button(self.scroll, label="Open", size=(60, -1))
-        open_btn.Bind(wx.EVT_BUTTON, lambda evt: webbrowser.open(url))
+        open_btn.SetClientData(url)
+        open_btn.Bind(wx.EVT_BUTTON, self._on_open_btn)
         url_sizer.Add(open_btn, 0, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 2)
         
         sizer.Add(url_sizer, 0, wx.EXPAND | wx.ALL, 5)
+        return url_text, copy_btn, open_btn
     
-    def _add_html_field(self, sizer: wx.StaticBoxSizer, html_content: str):
-        """Add HTML field with renderer."""
+    def _add_html_field(self, sizer: wx.Sizer, html_content: str):
+        """Add HTML field with renderer; returns (html window,)."""
         # Create HTML window
         html_window = wx.html.HtmlWindow(self.scroll, size=(-1, 200), style=wx.html.HW_SCROLLBAR_AUTO)
         
-        # Wrap content in basic HTML structure for better rendering
-        wrapped_html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; font-size: 10pt;">
-        {html_content}
-        </body>
-        </html>
-        """
-        
-        html_window.SetPage(wrapped_html)
-        html_window.SetBackgroundColour(wx.Colour(250, 250, 250))
+        html_window.SetBorders(0)
+        html_window.SetPage(self._wrap_html(html_content))
+        html_window.SetBackgroundColour(self._BG_LIGHT)
         
         sizer.Add(html_window, 1, wx.EXPAND | wx.ALL, 5)
+        return (html_window,)
     
-    def _add_long_text_field(self, sizer: wx.StaticBoxSizer, text: str):
-        """Add long text field with scrollable read-only text control."""
+    @staticmethod
+    def _wrap_html(html_content: str) -> str:
+        """Wrap content in basic HTML structure for better rendering."""
+        return _HTML_TEMPLATE % html_content
+    
+    def _add_long_text_field(self, sizer: wx.Sizer, text: str):
+        """
+        Add long text field with scrollable read-only text control.
+        
+        Very long text is loaded in _LONG_TEXT_CHUNK pieces (see _set_long_text).
+        
+        Returns:
+            (text ctrl, copy button, show more button)
+        """
         text_ctrl = wx.TextCtrl(
             self.scroll,
-            value=text,
             style=wx.TE_MULTILINE | wx.TE_READONLY | wx.TE_WORDWRAP,
             size=(-1, 150)
         )
-        text_ctrl.SetBackgroundColour(wx.Colour(250, 250, 250))
+        text_ctrl.SetBackgroundColour(self._BG_LIGHT)
         
         sizer.Add(text_ctrl, 1, wx.EXPAND | wx.ALL, 5)
         
-        # Add copy button
+        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        
+        # Show more button (only visible while part of the text is not loaded)
+        more_btn = wx.Button(self.scroll, label="Show more")
+        more_btn.SetClientData(text_ctrl)
+        more_btn.Bind(wx.EVT_BUTTON, self._on_show_more)
+        button_sizer.Add(more_btn, 0, wx.ALL, 2)
+        
+        # Add copy button (always copies the full text)
         copy_btn = wx.Button(self.scroll, label="Copy", size=(60, -1))
-        copy_btn.Bind(wx.EVT_BUTTON, lambda evt: self._copy_to_clipboard(text))
-        sizer.Add(copy_btn, 0, wx.ALIGN_RIGHT | wx.ALL, 2)
+        copy_btn.SetClientData(text)
+        copy_btn.Bind(wx.EVT_BUTTON, self._on_copy_btn)
+        button_sizer.Add(copy_btn, 0, wx.ALL, 2)
+        
+        sizer.Add(button_sizer, 0, wx.ALIGN_RIGHT)
+        
+        self._set_long_text(text_ctrl, more_btn, text)
+        return text_ctrl, copy_btn, more_btn
+    
+    def _set_long_text(self, text_ctrl: wx.TextCtrl, more_btn: wx.Button, text: str):
+        """
+        Show the first chunk of a long text; the rest is appended on "Show more".
+        
+        Wrapping a huge value in one go blocks the UI, so only _LONG_TEXT_CHUNK
+        characters are put in the control up front. The full text and the number
+        of characters loaded are kept as the control's client data.
+        """
+        shown = text[:_LONG_TEXT_CHUNK]
+        text_ctrl.ChangeValue(shown)
+        text_ctrl.SetClientData((text, len(shown)))
+        more_btn.Show(len(shown) < len(text))
+    
+    def _on_show_more(self, event):
+        """Append the next chunk of a long text field."""
+        more_btn = event.GetEventObject()
+        text_ctrl = more_btn.GetClientData()
+        text, loaded = text_ctrl.GetClientData()
+        
+        chunk = text[loaded:loaded + _LONG_TEXT_CHUNK]
+        text_ctrl.AppendText(chunk)
+        loaded += len(chunk)
+        text_ctrl.SetClientData((text, loaded))
+        
+        if loaded >= len(text):
+            more_btn.Hide()
+            self.scroll.Layout()
     
     def _add_short_text_field(self, sizer: wx.StaticBoxSizer, text: str):
-        """Add short text field as static text."""
+        """Add short text field as read-only text; returns (text ctrl,)."""
         text_ctrl = wx.TextCtrl(
             self.scroll,
             value=text,
@@ -249,6 +537,15 @@ class ResultDetailsPanel(wx.Panel):
         text_ctrl.SetBackgroundColour(self.GetBackgroundColour())
         
         sizer.Add(text_ctrl, 0, wx.EXPAND | wx.ALL, 5)
+        return (text_ctrl,)
+    
+    def _on_copy_btn(self, event):
+        """Copy the text stored on the clicked Copy button."""
+        self._copy_to_clipboard(event.GetEventObject().GetClientData())
+    
+    def _on_open_btn(self, event):
+        """Open the URL stored on the clicked Open button."""
+        webbrowser.open(event.GetEventObject().GetClientData())
     
     def _copy_to_clipboard(self, text: str):
         """Copy text to clipboard."""
@@ -261,13 +558,12 @@ class ResultDetailsPanel(wx.Panel):
         if not self.current_result:
             return
         
-        # Format all fields as text
-        lines = []
-        for field, value in self.current_result.items():
-            if value is not None and str(value).strip():
-                lines.append(f"{self._format_field_name(field)}: {value}")
-        
-        text = "\n\n".join(lines)
+        # Format all non-empty fields as text (blank strings are tested without a stripped copy)
+        text = "\n\n".join(
+            f"{self._format_field_name(field)}: {value}"
+            for field, value in self.current_result.items()
+            if value is not None and (not isinstance(value, str) or (value and not value.isspace()))
+        )
         self._copy_to_clipboard(text)
         
         # Show feedback